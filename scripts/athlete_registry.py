@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Append-only registry of discovered athletes (data/athlete-registry.ndjson)
+and the compaction step that folds it into the per-country snapshots
+(data/athletes.json, data/athletes-<country>.json).
+
+fetch_all_vzla.py checks every discovery against the registry and appends only
+new ones, so a discovery run writes O(new athletes) instead of re-sorting and
+rewriting the whole snapshot. Two kinds of lines:
+
+  {"seq": 812, "type": "athlete", "id": "ath_3f1c…", "country": "VEN", "key": "provider::league::name::team",
+   "at": ISO, "athlete": {name, sport, league, team, provider, …}}
+  {"seq": 813, "type": "compacted", "country": "VEN", "through": 812, "file": "data/athletes.json", "at": ISO}
+
+`id` is derived from country + key, so the same discovery always gets the same
+id. The key is athlete_key() of the athlete, for discoveries and bootstrapped
+snapshot entries alike; lines written under an older key are re-keyed on load
+(duplicates dropped) and the file is rewritten once (rewrite()). Compaction applies a country's athlete lines newer than its last
+"compacted" marker to the snapshot and rewrites the snapshot only if that added
+something. The snapshot stays the base: manual entries, gemrate flags and
+dedupe removals made there are kept, and a removed athlete is not re-added
+because its key is still registered.
+
+Usage:
+  python scripts/athlete_registry.py stats
+  python scripts/athlete_registry.py compact        # fold pending discoveries into the snapshots
+"""
+
+import argparse, hashlib, json, os
+from datetime import datetime, timezone
+
+from atomic_write import atomic_write_text
+
+REGISTRY_PATH = "data/athlete-registry.ndjson"
+
+
+def athlete_key(a):
+    return f"{a.get('provider','?')}::{a.get('league','?')}::{a.get('name','?')}::{a.get('team','?')}"
+
+
+def athlete_id(country, key):
+    return "ath_" + hashlib.sha1(f"{country}|{key}".encode("utf-8")).hexdigest()[:16]
+
+
+def sort_key(a):
+    return (a.get("sport", ""), a.get("league", ""), a.get("name", ""))
+
+
+class AthleteRegistry:
+    """In-memory view of the registry file; register() buffers, flush() appends."""
+
+    def __init__(self, path):
+        self.path = path
+        self.seq = 0
+        self.records = []     # athlete lines, oldest first
+        self.keys = {}        # country -> set of registered keys
+        self.compacted = {}   # country -> seq of the last compaction
+        self.files = {}       # country -> snapshot path (from its compaction markers)
+        self.markers = {}     # country -> its last "compacted" line
+        self.pending = []
+        self.rekeyed = 0      # lines loaded under an outdated key
+        self.dropped = 0      # lines loaded for a key that was already registered
+
+    @classmethod
+    def load(cls, path):
+        registry = cls(path)
+        if not os.path.exists(path):
+            return registry
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # torn final line from an interrupted append
+                try:
+                    registry._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    continue
+        return registry
+
+    def _apply(self, line):
+        self.seq = max(self.seq, line["seq"])
+        if line["type"] == "athlete":
+            key = athlete_key(line["athlete"])
+            if key != line["key"]:
+                # Discoveries used to be keyed by TheSportsDB team id / "golfteam"
+                self.rekeyed += 1
+                line = {**line, "key": key, "id": athlete_id(line["country"], key)}
+            if self.has(line["country"], key):
+                self.dropped += 1
+                return
+            self.records.append(line)
+            self.keys.setdefault(line["country"], set()).add(key)
+        elif line["type"] == "compacted":
+            self.compacted[line["country"]] = max(self.compacted.get(line["country"], 0), line["through"])
+            self.files[line["country"]] = line.get("file")
+            self.markers[line["country"]] = line
+
+    def _append(self, line):
+        self.seq += 1
+        line = {"seq": self.seq, **line}
+        self._apply(line)
+        self.pending.append(line)
+        return line
+
+    def knows(self, country):
+        return country in self.keys or country in self.compacted
+
+    def has(self, country, key):
+        return key in self.keys.get(country, ())
+
+    def register(self, country, key, athlete, at=None):
+        """Buffer a discovery; returns its line, or None if the key is already registered."""
+        if self.has(country, key):
+            return None
+        return self._append({
+            "type": "athlete",
+            "id": athlete_id(country, key),
+            "country": country,
+            "key": key,
+            "at": at or datetime.now(timezone.utc).isoformat(),
+            "athlete": athlete,
+        })
+
+    def mark_compacted(self, country, path):
+        self._append({
+            "type": "compacted",
+            "country": country,
+            "through": self.seq,
+            "file": path,
+            "at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    def bootstrap(self, country, path):
+        """First run for a country: register its existing snapshot as already compacted."""
+        for a in load_snapshot(path):
+            self.register(country, athlete_key(a), a)
+        self.mark_compacted(country, path)
+
+    def pending_for(self, country):
+        """Athlete lines not yet folded into the country's snapshot."""
+        through = self.compacted.get(country, 0)
+        return [r for r in self.records if r["country"] == country and r["seq"] > through]
+
+    def flush(self):
+        """Append buffered lines in one fsync'd write; returns how many were written."""
+        if not self.pending:
+            return 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(line, ensure_ascii=False) + "\n" for line in self.pending))
+            f.flush()
+            os.fsync(f.fileno())
+        written, self.pending = len(self.pending), []
+        return written
+
+    def rewrite(self):
+        """Atomically replace the file with the loaded lines (re-keyed, duplicates dropped), in seq order."""
+        self.flush()
+        lines = sorted(self.records + list(self.markers.values()), key=lambda line: line["seq"])
+        atomic_write_text(self.path, "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines))
+        self.rekeyed = self.dropped = 0
+
+
+def load_snapshot(path):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return []
+
+
+def write_snapshot(path, athletes):
+    """Atomic write in the committed format (indent=2, trailing newline, same as dedupe_athletes.py)."""
+    atomic_write_text(path, json.dumps(athletes, ensure_ascii=False, indent=2) + "\n")
+
+
+def compact(registry, country, path):
+    """
+    Fold the country's pending discoveries into its snapshot. The snapshot is
+    rewritten (sorted) only when at least one athlete is added; the
+    compaction marker is buffered either way. Returns the number added.
+    """
+    pending = registry.pending_for(country)
+    if not pending:
+        return 0
+
+    athletes = load_snapshot(path)
+    present = {athlete_key(a) for a in athletes}
+    added = 0
+    for record in pending:
+        athlete = record["athlete"]
+        if athlete_key(athlete) in present:
+            continue
+        present.add(athlete_key(athlete))
+        athletes.append(athlete)
+        added += 1
+
+    if added:
+        athletes.sort(key=sort_key)
+        write_snapshot(path, athletes)
+    registry.mark_compacted(country, path)
+    return added
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Athlete registry: stats and snapshot compaction")
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Registered athletes and pending discoveries per country")
+    sub.add_parser("compact", help="Fold pending discoveries into the per-country snapshots")
+    args = ap.parse_args()
+
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    registry = AthleteRegistry.load(REGISTRY_PATH)
+    if (registry.rekeyed or registry.dropped) and args.command == "compact":
+        print(f"🔁 Re-keyed {registry.rekeyed} line(s), dropped {registry.dropped} duplicate(s)")
+        registry.rewrite()
+
+    if args.command == "stats":
+        print(f"📒 {REGISTRY_PATH}: {len(registry.records)} athlete line(s), seq {registry.seq}")
+        for country in sorted(set(registry.keys) | set(registry.compacted)):
+            print(f"  {country}: {len(registry.keys.get(country, ()))} registered, "
+                  f"{len(registry.pending_for(country))} pending compaction")
+        return
+
+    for country, path in sorted(registry.files.items()):
+        added = compact(registry, country, path)
+        print(f"🗜️ {country}: {added} athlete(s) added to {path}" if added else f"💤 {country}: {path} unchanged")
+    registry.flush()
+
+
+if __name__ == "__main__":
+    main()
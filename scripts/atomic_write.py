@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Crash-safe file replacement shared by the data writers (fetch_gemrate.py,
+gemrate_history.py, athlete_registry.py, gemrate_archive.py, gemrate_events.py,
+fetch_all_vzla.py).
+
+The new content goes to a temp file in the target's directory, is fsync'd,
+then os.replace()'d over the target, so readers (and git) only ever see the
+old file or the complete new one.
+"""
+
+import json, os, tempfile
+
+
+def atomic_write_bytes(path, data: bytes):
+    """Write via a temp file in the same directory + os.replace (never a half-written file)."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # mkstemp creates 0600 files; keep the existing file's mode (or 0644)
+    mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(path), dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_text(path, text: str):
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_json(path, obj, indent=2):
+    atomic_write_bytes(path, json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8"))
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Offline replay harness + throughput benchmark for scripts/fetch_gemrate.py.
+
+Serves the fixture pages in scripts/fixtures/gemrate/ from a local stand-in
+for the gemrate.com /player POST endpoint (configurable latency, 403/429
+rates and Cloudflare block pages), then runs the real fetch + parse loop
+against it. No network access needed.
+
+Usage:
+  python scripts/bench_gemrate.py                          # 20 athletes, sequential, no sleeps
+  python scripts/bench_gemrate.py --async --rpm 600 --athletes 60
+  python scripts/bench_gemrate.py --latency-ms 400 --p-block 0.1 --delay-scale 0.01
+  python scripts/bench_gemrate.py --serve --port 8765      # stand-in only, then:
+    GEMRATE_URL=http://127.0.0.1:8765/player python scripts/fetch_gemrate.py
+
+Reports athletes/sec, parse µs/page per fixture and retry overhead (requests
+served beyond one per athlete x grader). Exits 1 if any fixture no longer
+parses to the value in fixtures/gemrate/expected.json.
+"""
+
+import argparse, asyncio, json, os, random, sys, tempfile, threading, time, timeit
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fetch_gemrate as fg  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "gemrate")
+
+# Share of successful (HTTP 200, not blocked) responses served per fixture
+DEFAULT_MIX = "normal=6,legacy=2,text_fallback=1,no_results=1"
+
+
+def load_fixtures():
+    """Return ({name: html}, expected) from FIXTURE_DIR."""
+    with open(os.path.join(FIXTURE_DIR, "expected.json"), "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    pages = {}
+    for file_name in expected:
+        with open(os.path.join(FIXTURE_DIR, file_name), "r", encoding="utf-8") as f:
+            pages[file_name.rsplit(".", 1)[0]] = f.read()
+    return pages, expected
+
+
+def parse_mix(spec: str):
+    """'normal=6,legacy=2' -> [(name, weight)]."""
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+
+class StandInConfig:
+    """Behaviour of the local /player stand-in; counters are updated under `lock`."""
+
+    def __init__(self, pages, mix, latency_ms=0.0, jitter_ms=0.0,
+                 p403=0.0, p429=0.0, p_block=0.0, seed=0):
+        self.pages = pages
+        self.mix = mix
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.p403 = p403
+        self.p429 = p429
+        self.p_block = p_block
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "200": 0, "403": 0, "429": 0, "blocked": 0, "bytes": 0, "newSessions": 0}
+
+    def pick_page(self, player: str, grader: str) -> str:
+        """Same athlete + grader always gets the same fixture."""
+        total = sum(w for _, w in self.mix)
+        point = (zlib.crc32(f"{player}|{grader}".encode("utf-8")) % 10_000) / 10_000 * total
+        for name, weight in self.mix:
+            if point < weight:
+                return name
+            point -= weight
+        return self.mix[-1][0]
+
+    def decide(self):
+        """Return (status, page, delay): page is None (error body), "blocked" or "" (pick from mix)."""
+        with self.lock:
+            roll = self.rng.random()
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        if roll < self.p403:
+            return 403, None, delay
+        roll -= self.p403
+        if roll < self.p429:
+            return 429, None, delay
+        roll -= self.p429
+        if roll < self.p_block:
+            return 200, "blocked", delay
+        return 200, "", delay
+
+
+def make_handler(config: StandInConfig):
+    class PlayerHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # headers + body go out as separate writes
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            player = (form.get("player") or [""])[0]
+            grader = (form.get("grader") or [""])[0]
+
+            status, page, delay = config.decide()
+            if delay:
+                time.sleep(delay)
+
+            if status == 200 and page == "":
+                page = config.pick_page(player, grader)
+            body = config.pages[page].replace("__PLAYER__", player) if page else "error"
+            payload = body.encode("utf-8")
+
+            # Like a real edge: hand out a session cookie to clients that arrive without one
+            cookieless = "gr_session=" not in (self.headers.get("Cookie") or "")
+
+            with config.lock:
+                config.counts["newSessions"] += int(cookieless)
+                config.counts["requests"] += 1
+                config.counts["bytes"] += len(payload)
+                config.counts["blocked" if page == "blocked" else str(status)] += 1
+
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            if cookieless:
+                self.send_header("Set-Cookie", f"gr_session={random.getrandbits(64):016x}; Path=/")
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return PlayerHandler
+
+
+def start_stand_in(config: StandInConfig, port: int = 0):
+    """Start the stand-in on 127.0.0.1 in a daemon thread; returns (server, url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/player"
+
+
+def check_fixtures(pages, expected):
+    """Parse every fixture; return [(fixture, expected, got)] mismatches."""
+    bad = []
+    for file_name, want in expected.items():
+        got = fg.parse_summary(pages[file_name.rsplit(".", 1)[0]])
+        if got != want:
+            bad.append((file_name, want, got))
+    return bad
+
+
+def time_parse(pages, number: int):
+    """Return {fixture: µs per parse_summary() call}."""
+    return {
+        name: round(timeit.timeit(lambda: fg.parse_summary(page), number=number) / number * 1e6, 1)
+        for name, page in pages.items()
+    }
+
+
+def scale_delays(scale: float):
+    """Multiply every politeness / backoff sleep in fetch_gemrate by `scale`."""
+    for attr in ("DELAY_MIN", "DELAY_MAX", "GRADER_DELAY_MIN", "GRADER_DELAY_MAX",
+                 "PACE_BREAKER_COOLDOWN_SEC", "PACE_BREAKER_MAX_COOLDOWN_SEC"):
+        setattr(fg, attr, getattr(fg, attr) * scale)
+
+
+def run_benchmark(args, config, url):
+    """Run the real sync/async batch loop against the stand-in; return the report dict."""
+    fg.GEMRATE_URL = url
+    scale_delays(args.delay_scale)
+
+    batch = [(i, {"name": f"Bench Player {i:04d}", "sport": "Baseball"}) for i in range(args.athletes)]
+    logical = len(batch) * len(fg.GRADERS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = fg.Journal(os.path.join(tmp, "journal.ndjson"))
+        metrics = fg.RunMetrics()
+        started = time.perf_counter()
+        if args.use_async:
+            records = asyncio.run(
+                fg.run_batch_async(batch, len(batch), args.rpm, args.concurrency, journal, metrics)
+            )
+        else:
+            records = fg.run_batch_sync(batch, len(batch), journal, metrics)
+        elapsed = time.perf_counter() - started
+
+    outcomes = {"hit": 0, "zero": 0, "failed": 0}
+    for record in records:
+        outcomes[fg.classify_outcome(list(record["stats"].values()))] += 1
+
+    served = config.counts["requests"]
+    return {
+        "mode": f"async rpm={args.rpm:g} concurrency={args.concurrency}" if args.use_async else "sequential",
+        "athletes": len(batch),
+        "graders": len(fg.GRADERS),
+        "elapsedSec": round(elapsed, 3),
+        "athletesPerSec": round(len(batch) / elapsed, 3) if elapsed else None,
+        "requestsServed": served,
+        "logicalRequests": logical,
+        "retries": served - logical,
+        "retryOverheadPct": round((served - logical) / logical * 100, 1) if logical else 0.0,
+        "served": dict(config.counts),
+        "outcomes": outcomes,
+        "telemetry": metrics.summary(),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Offline Gemrate scraper benchmark")
+    ap.add_argument("--athletes", type=int, default=20, help="Synthetic athletes per benchmark run")
+    ap.add_argument("--async", dest="use_async", action="store_true", help="Benchmark the --async runner")
+    ap.add_argument("--rpm", type=float, default=600, help="Token bucket budget for --async")
+    ap.add_argument("--concurrency", type=int, default=fg.ASYNC_MAX_IN_FLIGHT)
+    ap.add_argument("--delay-scale", type=float, default=0.0,
+                    help="Multiplier for polite delays and backoff sleeps (0 = none, 1 = production)")
+    ap.add_argument("--latency-ms", type=float, default=50.0, help="Stand-in response latency")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="± uniform jitter on latency")
+    ap.add_argument("--p403", type=float, default=0.0, help="Probability of an HTTP 403")
+    ap.add_argument("--p429", type=float, default=0.0, help="Probability of an HTTP 429")
+    ap.add_argument("--p-block", type=float, default=0.0, help="Probability of a Cloudflare block page")
+    ap.add_argument("--mix", default=DEFAULT_MIX, help="Weights of the non-blocked fixtures served")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--parse-iterations", type=int, default=500)
+    ap.add_argument("--serve", action="store_true", help="Only run the stand-in until Ctrl+C")
+    ap.add_argument("--port", type=int, default=0, help="Stand-in port (0 = any free port)")
+    ap.add_argument("--json-out", help="Optional path for the JSON report")
+    args = ap.parse_args()
+
+    pages, expected = load_fixtures()
+    config = StandInConfig(
+        pages, parse_mix(args.mix), args.latency_ms, args.jitter_ms,
+        args.p403, args.p429, args.p_block, args.seed,
+    )
+    server, url = start_stand_in(config, args.port)
+
+    if args.serve:
+        print(f"🧪 Gemrate stand-in listening on {url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+            return 0
+
+    mismatches = check_fixtures(pages, expected)
+    for file_name, want, got in mismatches:
+        print(f"❌ {file_name}: expected {want}, parsed {got}", file=sys.stderr)
+
+    parse_us = time_parse(pages, args.parse_iterations)
+    report = run_benchmark(args, config, url)
+    report["parseMicrosPerPage"] = parse_us
+    report["fixturesOk"] = not mismatches
+    server.shutdown()
+
+    print("\n📈 Gemrate offline benchmark")
+    print(f"   mode:            {report['mode']}")
+    print(f"   athletes/sec:    {report['athletesPerSec']} ({report['athletes']} athletes in {report['elapsedSec']}s)")
+    print(f"   requests:        {report['requestsServed']} served / {report['logicalRequests']} logical "
+          f"(+{report['retryOverheadPct']}% retries)")
+    print(f"   outcomes:        {report['outcomes']}")
+    telemetry = report["telemetry"]
+    print(f"   latency:         p50 {telemetry['latencyMs']['p50']} ms, p95 {telemetry['latencyMs']['p95']} ms")
+    print(f"   time:            busy {telemetry['busySec']}s, idle {telemetry['idleSec']}s "
+          f"(sleeping {telemetry['sleepSec']}s), parse paths {telemetry['parsePaths']}")
+    for name, us in parse_us.items():
+        print(f"   parse {name:<14} {us} µs/page")
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Assertion checks for the rules the data scripts rely on, run in CI before the
+scripts themselves (no network, no data files touched).
+
+Usage:
+  python scripts/check_rules.py
+
+Each check_* function asserts one rule; a failure prints which one broke and
+the script exits 1.
+"""
+
+import copy, os, sys, tempfile, traceback
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import dedupe_athletes as da  # noqa: E402
+import fetch_gemrate as fg  # noqa: E402
+import merge_gemrate_shards as mgs  # noqa: E402
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def check_fuzzy_scores():
+    """dedupe_athletes.score_pair: middle names the other athlete lacks lower the spelling score."""
+    def score(x, y):
+        return da.score_pair(da.name_tokens(x), da.name_tokens(y), da.FUZZY_MIN_SCORE)[0]
+
+    # Different players (baseball / soccer); first + last alone scored 0.956
+    assert score("Jose Andres Martinez", "Josef Martinez") < da.FUZZY_MIN_SCORE
+    assert score("Josef Martinez", "Jose Andres Martinez") < da.FUZZY_MIN_SCORE
+    # Same middle name on both sides: no penalty
+    assert score("Jose Andres Martinez", "Jose Andres Martines") >= da.FUZZY_MIN_SCORE
+    assert score("Kenedy Corona", "Kennedy Corona") >= 0.95
+    assert score("Jose Altuve", "Jose Carlos Altuve") == 0.9
+    assert score("Enzo Hernandez", "Leo Hernandez") < da.FUZZY_MIN_SCORE
+
+
+def check_due_ladder():
+    """fetch_gemrate.next_due_at: 21d after a hit, 30d doubling to 360d after zeros, 12h doubling to 21d after failures."""
+    def ladder(result, runs):
+        entry, gaps = {}, []
+        for _ in range(runs):
+            due, zero_streak, fail_streak = fg.next_due_at(result, entry, NOW)
+            entry = {"zeroStreak": zero_streak, "failStreak": fail_streak}
+            gaps.append(due - NOW)
+        return gaps
+
+    assert ladder("hit", 2) == [timedelta(days=21)] * 2
+    assert ladder("zero", 6) == [timedelta(days=d) for d in (30, 60, 120, 240, 360, 360)]
+    assert ladder("failed", 8) == [timedelta(hours=h) for h in (12, 24, 48, 96, 192, 384, 504, 504)]
+
+    # A hit resets both streaks; a zero resets the failure streak only
+    assert fg.next_due_at("hit", {"zeroStreak": 4, "failStreak": 3}, NOW)[1:] == (0, 0)
+    assert fg.next_due_at("zero", {"zeroStreak": 1, "failStreak": 3}, NOW)[1:] == (2, 0)
+    assert fg.classify_outcome([dict(fg.NO_RESULTS), {**fg.NO_RESULTS, "grades": 3}, None]) == "hit"
+    assert fg.classify_outcome([dict(fg.NO_RESULTS), None, dict(fg.NO_RESULTS)]) == "failed"
+    assert fg.classify_outcome([dict(fg.NO_RESULTS)] * 3) == "zero"
+
+
+def check_journal_replay():
+    """fetch_gemrate.Journal: replayed athletes are not due again; a torn line and a second replay change nothing."""
+    hit = {**fg.NO_RESULTS, "cards": 9, "grades": 9}
+    records = [
+        {"at": NOW.isoformat(), "name": "A", "sport": "Baseball", "stats": {"PSA": hit, "SGC": None, "beckett": dict(fg.NO_RESULTS)}},
+        {"at": NOW.isoformat(), "name": "B", "sport": "Soccer", "stats": {g["key"]: dict(fg.NO_RESULTS) for g in fg.GRADERS}},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = fg.Journal(os.path.join(tmp, "journal.ndjson"))
+        for record in records:
+            journal.append(record)
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"at": "2026-01-01T00:00:00+00:00", "name": "C"')  # crash mid-append
+        replayed = journal.read()
+        assert replayed == records
+        assert journal.read() == records  # the torn line was cut, not left for the next append
+
+    results = {g["key"]: {} for g in fg.GRADERS}
+    state = {}
+    for record in replayed:
+        fg.apply_record(results, state, record)
+    once = copy.deepcopy((results, state))
+    for record in replayed:
+        fg.apply_record(results, state, record)
+    assert (results, state) == once
+
+    # The run that replays them only fetches athletes that are still due
+    later = NOW + timedelta(hours=1)
+    assert not fg.is_due(state["A"], later) and not fg.is_due(state["B"], later)
+    assert fg.is_due(state.get("C"), later)
+    assert list(results["PSA"]) == ["A"] and not results["SGC"] and not results["beckett"]
+
+
+def check_shard_merge():
+    """merge_gemrate_shards.collect_records: records ordered by (at, name), same name + at merged once."""
+    names = ["Ana", "Beto", "Carla", "Dario", "Elena", "Fito"]
+    assert all(fg.shard_of(name, 2) == fg.shard_of(name.upper(), 2) in (0, 1) for name in names)
+
+    def record(name, minute, grades):
+        stats = {**fg.NO_RESULTS, "cards": grades, "grades": grades}
+        return {"at": (NOW + timedelta(minutes=minute)).isoformat(), "name": name, "stats": {"PSA": stats}}
+
+    # Written out of order; every athlete twice, the second time 30 minutes later
+    written = [record(name, minute, minute + 1) for minute in (30, 0) for name in reversed(names)]
+    with tempfile.TemporaryDirectory() as tmp:
+        journals = [fg.Journal(os.path.join(tmp, f"journal-{k}-of-2.ndjson")) for k in (0, 1)]
+        for r in written:
+            journals[fg.shard_of(r["name"], 2)].append(r)
+        journals[fg.shard_of("Ana", 2)].append(written[-1])  # re-appended by a retried job
+        records, _ = mgs.collect_records(tmp)
+
+    assert records == sorted(written, key=lambda r: (r["at"], r["name"]))
+    assert [r["name"] for r in records[:len(names)]] == names
+
+    # Applied in that order, the newest record for a name wins
+    results = {g["key"]: {} for g in fg.GRADERS}
+    for r in records:
+        fg.apply_record(results, {}, r)
+    assert all(results["PSA"][name]["totals"]["grades"] == 31 for name in names)
+
+
+CHECKS = [
+    check_fuzzy_scores,
+    check_due_ladder,
+    check_journal_replay,
+    check_shard_merge,
+]
+
+
+def main() -> int:
+    failed = 0
+    for check in CHECKS:
+        try:
+            check()
+            print(f"✅ {check.__name__}")
+        except Exception:
+            failed += 1
+            print(f"❌ {check.__name__}: {check.__doc__}")
+            traceback.print_exc()
+    print(f"🏁 {len(CHECKS) - failed}/{len(CHECKS)} check(s) passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import re
 import sys
 import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
+# Fuzzy mode: name tokens ignored when comparing ("Ronald Acuna Jr." ~ "Ronald Acuna").
+# "V" is usually a middle initial, so it only counts as a suffix at the end of
+# the name after a comma ("Smith, V") or after three or more other names.
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+FUZZY_MIN_SCORE = 0.88
+# Spelling scores compare first and last names only; each middle name that the
+# other athlete lacks multiplies the score by this ("Jose Andres Martinez" is
+# not "Josef Martinez").
+FUZZY_MIDDLE_PENALTY = 0.9
+# Blocks bigger than this are split again on finer keys, so no block grows
+# with the roster and the pair count stays near-linear. A block that is still
+# too big at the finest key is compared in a sorted window of this size.
+FUZZY_MAX_BLOCK = 40
+
 
 def strip_accents(name: str) -> str:
     """Remove accent/diacritic marks but preserve original casing and spacing."""
@@ -31,6 +49,163 @@ def normalize_name(name: str) -> str:
     return name.lower()
 
 
+def name_tokens(name: str) -> list:
+    """normalize_name() split into tokens, without punctuation or generational suffixes ("A.J." -> "a j")."""
+    normalized = normalize_name(name)
+    tokens = re.sub(r"[^a-z0-9 ]+", " ", normalized).split()
+    core = [t for t in tokens if t not in NAME_SUFFIXES]
+    if core[-1:] == ["v"] and (len(core) > 3 or re.search(r",\s*v\.?$", normalized)):
+        core = core[:-1]
+    return core or tokens
+
+
+def soundex(token: str) -> str:
+    """American Soundex (letter + 3 digits); enough to bucket surname spellings like Acuna/Akuna."""
+    codes = {c: str(d) for d, letters in enumerate(("aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r")) for c in letters}
+    token = "".join(ch for ch in token if ch.isalpha())
+    if not token:
+        return ""
+    out, last = token[0].upper(), codes.get(token[0], "")
+    for ch in token[1:]:
+        code = codes.get(ch, "")
+        if code and code != "0" and code != last:
+            out += code
+        if ch not in "hw":
+            last = code
+    return (out + "000")[:4]
+
+
+def blocking_keys(tokens: list, sport: str) -> list:
+    """
+    Block key chains, coarsest first, all within one sport: surname sound
+    (then + first initial, then + first-name sound), first-name sound +
+    surname initial for typos early in the surname (then + the surname's
+    first two letters, then + surname sound), and the sorted name tokens
+    (swapped order). Each finer key extends its parent, so a split never
+    mixes athletes from different parent blocks.
+    """
+    first, last = tokens[0], tokens[-1]
+    sf, sl = soundex(first), soundex(last)
+    surname = f"{sport}|L|{sl}"
+    given = f"{sport}|F|{sf}|{last[0]}"
+    return [
+        [surname, f"{surname}|{first[0]}", f"{surname}|{first[0]}|{sf}"],
+        [given, f"{given}|{last[:2]}", f"{given}|{last[:2]}|{sl}"],
+        [f"{sport}|T|{' '.join(sorted(tokens))}"],
+    ]
+
+
+@lru_cache(maxsize=1 << 16)
+def similarity(x: str, y: str) -> float:
+    """SequenceMatcher ratio, memoized: the same given names and surnames meet over and over."""
+    return SequenceMatcher(None, x, y, autojunk=False).ratio()
+
+
+def length_bound(x: str, y: str) -> float:
+    """Upper bound of similarity(x, y) from the lengths alone (no alignment needed)."""
+    return 2 * min(len(x), len(y)) / (len(x) + len(y)) if x or y else 1.0
+
+
+def score_pair(a: list, b: list, min_score: float = 0.0) -> tuple:
+    """(confidence 0..1, reason) that two token lists (see name_tokens) name the same athlete."""
+    if a == b:
+        # Only a suffix told them apart: often a typo, sometimes father and son
+        return 0.9, "differs only by Jr./Sr./II suffix"
+    sa, sb = set(a), set(b)
+    if sa == sb:
+        return 0.95, "same names, different order"
+    short, long_ = (sa, sb) if len(sa) <= len(sb) else (sb, sa)
+    if len(short) >= 2 and short <= long_ and a[-1] == b[-1]:
+        return 0.9, "extra given/middle name"
+    if len(a) == 1 or len(b) == 1:
+        x, y = " ".join(a), " ".join(b)
+        if length_bound(x, y) < min_score:
+            return 0.0, "similar spelling"
+        ratio = similarity(x, y)
+    else:
+        unmatched = sum(1 for t in a[1:-1] if t not in sb) + sum(1 for t in b[1:-1] if t not in sa)
+        penalty = FUZZY_MIDDLE_PENALTY ** unmatched
+        # Surnames weigh more: "Enzo Hernandez" vs "Leo Hernandez" must not pass on the shared surname
+        if (0.4 * length_bound(a[0], b[0]) + 0.6 * length_bound(a[-1], b[-1])) * penalty < min_score:
+            return 0.0, "similar spelling"
+        ratio = (0.4 * similarity(a[0], b[0]) + 0.6 * similarity(a[-1], b[-1])) * penalty
+    return round(ratio, 3), "similar spelling"
+
+
+def fuzzy_candidates(athletes: list, min_score: float) -> tuple:
+    """
+    Likely duplicates among `athletes` that exact normalization kept apart.
+
+    Each athlete is placed in a few blocks keyed by sport + name sounds;
+    only pairs that share a block are scored. A block over FUZZY_MAX_BLOCK is
+    split on the next key of its chain; one still too big at the finest key
+    is sorted by name and each athlete compared with the next
+    FUZZY_MAX_BLOCK - 1 only. Work grows with roster size times block size,
+    not with its square. Returns (candidates sorted by confidence, stats).
+    """
+    tokens = {}
+    pending = defaultdict(list)
+    chains = {}
+    for i, athlete in enumerate(athletes):
+        name = athlete.get("name", "") if isinstance(athlete, dict) else ""
+        toks = name_tokens(name)
+        if not toks:
+            continue
+        tokens[i] = toks
+        sport = normalize_name(athlete.get("sport", ""))
+        for chain in blocking_keys(toks, sport):
+            pending[chain[0]].append(i)
+            chains[(chain[0], i)] = chain[1:]
+
+    blocks, windowed = {}, {}
+    queue = list(pending.items())
+    while queue:
+        key, members = queue.pop()
+        if len(members) <= FUZZY_MAX_BLOCK:
+            blocks[key] = members
+            continue
+        finer = defaultdict(list)
+        for i in members:
+            rest = chains[(key, i)]
+            if rest:
+                finer[rest[0]].append(i)
+                chains[(rest[0], i)] = rest[1:]
+        if finer:
+            queue.extend(finer.items())
+        else:
+            windowed[key] = sorted(members, key=lambda i: (tokens[i], i))
+
+    scored = set()
+    candidates = []
+
+    def score(i, j):
+        i, j = min(i, j), max(i, j)
+        if (i, j) in scored:
+            return
+        scored.add((i, j))
+        value, reason = score_pair(tokens[i], tokens[j], min_score)
+        if value >= min_score:
+            candidates.append({"score": value, "reason": reason, "kept_index": i, "other_index": j})
+
+    for members in blocks.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                score(members[x], members[y])
+    for members in windowed.values():
+        for x in range(len(members)):
+            for y in range(x + 1, min(x + FUZZY_MAX_BLOCK, len(members))):
+                score(members[x], members[y])
+
+    candidates.sort(key=lambda c: (-c["score"], c["kept_index"], c["other_index"]))
+    stats = {
+        "blocks": len(blocks) + len(windowed),
+        "pairs_scored": len(scored),
+        "windowed_blocks": len(windowed),
+        "athletes_in_windowed_blocks": sum(len(m) for m in windowed.values()),
+    }
+    return candidates, stats
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", default="data/athletes.json", help="Path to athletes.json")
@@ -40,6 +215,18 @@ def main() -> int:
         default="data/athletes_dedupe_report.json",
         help="Write details of removed duplicates here",
     )
+    ap.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="Also report likely duplicates that differ in spelling, suffixes or name order",
+    )
+    ap.add_argument("--fuzzy-min-score", type=float, default=FUZZY_MIN_SCORE, help="Lowest confidence to report")
+    ap.add_argument(
+        "--fuzzy-merge-above",
+        type=float,
+        default=None,
+        help="Also remove the newer athlete of fuzzy pairs at or above this confidence (default: report only)",
+    )
     args = ap.parse_args()
 
     in_path = Path(args.input)
@@ -62,6 +249,7 @@ def main() -> int:
 
     seen = {}  # normalized_name -> kept_index
     kept = []
+    kept_index = []  # original index of each kept athlete
     removed = []
 
     for idx, athlete in enumerate(data):
@@ -71,6 +259,7 @@ def main() -> int:
         # If no name, keep it (can't safely dedupe)
         if not norm:
             kept.append(athlete)
+            kept_index.append(idx)
             continue
 
         # Keep the oldest = first seen occurrence
@@ -80,6 +269,7 @@ def main() -> int:
             if isinstance(athlete, dict) and "name" in athlete:
                 athlete["name"] = strip_accents(athlete["name"])
             kept.append(athlete)
+            kept_index.append(idx)
         else:
             removed.append(
                 {
@@ -91,11 +281,53 @@ def main() -> int:
                 }
             )
 
+    fuzzy = None
+    if args.fuzzy:
+        candidates, stats = fuzzy_candidates(kept, args.fuzzy_min_score)
+        merged = set()
+        for c in candidates:
+            i, j = c["kept_index"], c["other_index"]
+            c.update({
+                "kept_name": kept[i].get("name"),
+                "other_name": kept[j].get("name"),
+                "sport": kept[i].get("sport"),
+                "teams": [kept[i].get("team"), kept[j].get("team")],
+                "kept_index": kept_index[i],
+                "other_index": kept_index[j],
+                "merged": False,
+            })
+            # Keep the oldest; a pair whose athlete was already merged away is left alone
+            if args.fuzzy_merge_above is not None and c["score"] >= args.fuzzy_merge_above \
+                    and i not in merged and j not in merged:
+                merged.add(j)
+                c["merged"] = True
+                removed.append({
+                    "normalized": " ".join(name_tokens(kept[j].get("name", ""))),
+                    "kept_original_index": kept_index[i],
+                    "removed_original_index": kept_index[j],
+                    "kept_name": kept[i].get("name"),
+                    "removed_name": kept[j].get("name"),
+                    "fuzzy_score": c["score"],
+                })
+        if merged:
+            kept = [a for k, a in enumerate(kept) if k not in merged]
+        fuzzy = {"min_score": args.fuzzy_min_score, **stats, "candidates": candidates}
+        print(f"[dedupe] 🔎 Fuzzy: {len(candidates)} candidate pair(s) from {stats['pairs_scored']} scored "
+              f"in {stats['blocks']} blocks; {len(merged)} merged.")
+        if stats["windowed_blocks"]:
+            print(f"[dedupe] ⚠ {stats['windowed_blocks']} block(s) ({stats['athletes_in_windowed_blocks']} "
+                  f"athlete placements) too big even at the finest key; compared in a sorted "
+                  f"window of {FUZZY_MAX_BLOCK} only.")
+
     # Write outputs
     out_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.parent.mkdir(parents=True, exist_ok=True)
 
-    out_path.write_text(json.dumps(kept, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    # Only touch the snapshot when deduping actually changed it
+    text = json.dumps(kept, ensure_ascii=False, indent=2) + "\n"
+    unchanged = out_path.exists() and out_path.read_text(encoding="utf-8") == text
+    if not unchanged:
+        out_path.write_text(text, encoding="utf-8")
     report = {
         "input": str(in_path),
         "output": str(out_path),
@@ -104,13 +336,15 @@ def main() -> int:
         "removed_count": len(removed),
         "removed": removed,
     }
+    if fuzzy is not None:
+        report["fuzzy"] = fuzzy
     report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
     if removed:
         print(f"[dedupe] ✅ Deduped by name. Removed {len(removed)} duplicate(s). Kept oldest entries.")
         print(f"[dedupe] Report: {report_path}")
     else:
-        print("[dedupe] ✅ No duplicates found. No changes made (content may be rewritten identically).")
+        print("[dedupe] ✅ No duplicates found." + (" Output unchanged, not rewritten." if unchanged else ""))
 
     return 0
 
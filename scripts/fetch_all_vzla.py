@@ -1,8 +1,19 @@
 import os
 import json
+import hashlib
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+
+from athlete_registry import REGISTRY_PATH, AthleteRegistry, athlete_key, compact
+from atomic_write import atomic_write_json
+from dedupe_athletes import normalize_name
 
 # =========================
 # CONFIG
@@ -22,27 +33,57 @@ BDB_PER_PAGE = 100
 TSDB_KEY = os.environ.get("SPORTSDB_KEY", "").strip() or None
 TSDB_BASE = f"https://www.thesportsdb.com/api/v1/json/{TSDB_KEY}" if TSDB_KEY else None
 
-# Target
-COUNTRY_TARGET = "venezuela"
-FILE_PATH = "data/athletes.json"
+# Targets: every downloaded roster is classified for all of these at once.
+# Free-text fields (birth places, names) match a name/alias on word boundaries;
+# code fields (nationality, country_code) also match the ISO codes exactly.
+TARGET_COUNTRIES: List[Dict[str, Any]] = [
+    {"code": "VEN", "name": "Venezuela", "iso": ["VE", "VEN"],
+     "aliases": ["venezuelan", "venezolano", "venezolana"],
+     "file": "data/athletes.json"},
+    {"code": "DOM", "name": "Dominican Republic", "iso": ["DO", "DOM"],
+     "aliases": ["dominican", "republica dominicana", "rep. dominicana", "dominicano", "dominicana"],
+     "file": "data/athletes-dominican-republic.json"},
+    {"code": "COL", "name": "Colombia", "iso": ["CO", "COL"],
+     "aliases": ["colombian", "colombiano", "colombiana"],
+     "file": "data/athletes-colombia.json"},
+]
+# Comma-separated codes to track this run (default: all of TARGET_COUNTRIES)
+ATHLETE_COUNTRIES = [c.strip().upper() for c in os.environ.get("ATHLETE_COUNTRIES", "").split(",") if c.strip()]
 
 # TSDB cache (to avoid re-hitting the same rosters every run)
 TSDB_CACHE_PATH = "data/tsdb_cache.json"
 
-# Free-tier safety
+# BDB cursor checkpoints: each run continues an endpoint's sweep where the last one stopped
+BDB_CURSORS_PATH = "data/bdb_cursors.json"
+
+# Free-tier safety. Spacing is the default until the provider's rate-limit headers say otherwise.
 BDB_SLEEP_SEC = 13
+BDB_MIN_INTERVAL_SEC = 1.0
+BDB_429_PAUSE_SEC = 60
 BDB_MAX_PAGES_PER_ENDPOINT = 50
 
-# TSDB safety (free-tier is strict)
+# TSDB safety (free-tier is strict). The spacing is global: every worker shares it.
 TSDB_SLEEP_SEC = 8.0
-TSDB_MAX_TEAMS_PER_LEAGUE = 40
+TSDB_MIN_INTERVAL_SEC = 2.0
+TSDB_WORKERS = 4
+TSDB_REQUEST_BUDGET = 400  # TSDB calls per run (retries + golf included); unscanned teams carry over to the next run
 TSDB_MAX_RETRIES = 7
 TSDB_BACKOFF_START = 6.0
 REQUEST_TIMEOUT = 30
 
+# Per-provider, per-endpoint request telemetry; keeps the last METRICS_HISTORY runs
+METRICS_PATH = "data/athlete-sync-metrics.json"
+METRICS_HISTORY = 24
+
 # If a team roster call fails (429/give-up), wait before retrying that team on future runs
 TSDB_TEAM_RETRY_COOLDOWN_SEC = 6 * 60 * 60  # 6 hours
 
+# Cached rosters are re-fetched after this long (spread ±25% per team so refreshes
+# roll across runs); an unchanged roster hash skips filtering and merging.
+TSDB_ROSTER_TTL_SEC = 30 * 24 * 60 * 60
+# League name + team list
+TSDB_LEAGUE_TTL_SEC = 7 * 24 * 60 * 60
+
 # =========================
 # BALLDONTLIE ENDPOINTS (free-safe list)
 # =========================
@@ -107,83 +148,171 @@ TSDB_GOLF_TOP_TOURS: List[Dict[str, str]] = [
 # HELPERS
 # =========================
 
-def load_existing_athletes() -> List[Dict[str, Any]]:
-    if os.path.exists(FILE_PATH):
-        with open(FILE_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
-
-def save_athletes(items: List[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(FILE_PATH), exist_ok=True)
-    with open(FILE_PATH, "w", encoding="utf-8") as f:
-        json.dump(items, f, indent=4, ensure_ascii=False)
-
 def load_tsdb_cache() -> Dict[str, Any]:
     """
     Backward-compatible cache loader.
 
-    Old schema:
+    Old schemas:
       { "scanned_team_ids": [ ... ] }
+      { "scanned_team_ids": [ ... ], "team_next_retry": { "TEAM_ID": UNIX_TS, ... } }
 
-    New schema:
+    Current schema:
       {
-        "scanned_team_ids": [ ... ],
-        "team_next_retry": { "TEAM_ID": UNIX_TS, ... }
+        "team_next_retry": { "TEAM_ID": UNIX_TS, ... },
+        "rosters": { "TEAM_ID": { "hash": SHA1, "fetchedAt": UNIX_TS, "players": N,
+                                  "classified": [ "VEN:1a2b3c4d", ... ] }, ... },
+        "leagues": { "LEAGUE_ID": { "name": STR, "teams": [ {idTeam, strTeam, strCountry} ],
+                                    "hash": SHA1, "fetchedAt": UNIX_TS, "classified": [ ... ] }, ... }
       }
+
+    `classified` lists the classifier_signatures() the content was matched
+    against (golf tours only, among leagues).
+
+    Teams listed in an old scanned_team_ids become rosters with no hash and
+    fetchedAt=0, i.e. first in line for a refresh.
     """
+    data = None
     if os.path.exists(TSDB_CACHE_PATH):
         try:
             with open(TSDB_CACHE_PATH, "r", encoding="utf-8") as f:
                 data = json.load(f)
+        except Exception:
+            pass
+    if not isinstance(data, dict):
+        data = {}
+
+    # normalize types
+    for key in ("team_next_retry", "rosters", "leagues"):
+        if not isinstance(data.get(key), dict):
+            data[key] = {}
+    legacy = data.pop("scanned_team_ids", None)
+    if isinstance(legacy, list):
+        for team_id in legacy:
+            data["rosters"].setdefault(str(team_id), {"hash": None, "fetchedAt": 0})
+    return data
+
+def save_tsdb_cache(cache: Dict[str, Any]) -> None:
+    atomic_write_json(TSDB_CACHE_PATH, cache)
+
+def load_bdb_cursors() -> Dict[str, Any]:
+    """
+    Per-endpoint pagination checkpoints, keyed by endpoint path:
+      { "/mlb/v1/players": { "cursor": "12345" | null, "pages": 50, "sweeps": 1,
+                             "updatedAt": ISO, "lastSweepAt": ISO } }
+    cursor=null means the next run starts a new sweep from page one.
+    """
+    if os.path.exists(BDB_CURSORS_PATH):
+        try:
+            with open(BDB_CURSORS_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
             if isinstance(data, dict):
-                data.setdefault("scanned_team_ids", [])
-                data.setdefault("team_next_retry", {})
-                # normalize types
-                if not isinstance(data["scanned_team_ids"], list):
-                    data["scanned_team_ids"] = []
-                if not isinstance(data["team_next_retry"], dict):
-                    data["team_next_retry"] = {}
                 return data
         except Exception:
             pass
-    return {"scanned_team_ids": [], "team_next_retry": {}}
+    return {}
 
-def save_tsdb_cache(cache: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(TSDB_CACHE_PATH), exist_ok=True)
-    with open(TSDB_CACHE_PATH, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+def save_bdb_cursors(cursors: Dict[str, Any]) -> None:
+    atomic_write_json(BDB_CURSORS_PATH, cursors)
+
+class DiscoveryIndex:
+    """
+    Thread-safe de-dupe index shared by the provider scanners, backed by the
+    athlete registry (one key set per country). Records are keyed with
+    athlete_registry.athlete_key() (provider::league::name::team), the same
+    key the registry bootstraps from the snapshots; add() registers a record
+    only for a key that country has never seen.
+    """
+
+    def __init__(self, registry: AthleteRegistry):
+        self.registry = registry
+        self.added = {c["code"]: 0 for c in COUNTRIES}
+        self._lock = threading.Lock()
 
-def contains_venezuela(text: Optional[str]) -> bool:
-    return isinstance(text, str) and (COUNTRY_TARGET in text.lower())
+    def add(self, country: str, record: Dict[str, Any]) -> bool:
+        with self._lock:
+            if self.registry.register(country, athlete_key(record), dict(record)) is None:
+                return False
+            self.added[country] += 1
+            return True
 
-def is_venezuelan_bdb(rec: Dict[str, Any], birthplace_field: str) -> bool:
-    if contains_venezuela(rec.get(birthplace_field)):
-        return True
+class CountryMatcher:
+    """
+    All target countries compiled into one word-boundary regex over accent-
+    folded text, plus one exact-value map for code-like fields, so a roster
+    entry is classified for every country in a single pass.
+    """
+
+    def __init__(self, countries: List[Dict[str, Any]]):
+        self.by_alias: Dict[str, str] = {}
+        self.by_value: Dict[str, str] = {}
+        for c in countries:
+            for alias in [c["name"], *c.get("aliases", [])]:
+                self.by_alias[normalize_name(alias)] = c["code"]
+            for value in [c["name"], *c.get("aliases", []), *c.get("iso", [])]:
+                self.by_value[normalize_name(value)] = c["code"]
+        alternatives = sorted(self.by_alias, key=len, reverse=True)
+        self.pattern = re.compile(r"\b(" + "|".join(re.escape(a) for a in alternatives) + r")\b") if alternatives else None
+
+    def in_text(self, text: Any) -> Set[str]:
+        if not self.pattern or not isinstance(text, str) or not text:
+            return set()
+        return {self.by_alias[m] for m in self.pattern.findall(normalize_name(text))}
+
+    def in_value(self, value: Any) -> Set[str]:
+        """Exact name / alias / ISO code, falling back to a text match ("Venezuela (VEN)")."""
+        if not isinstance(value, str) or not value.strip():
+            return set()
+        code = self.by_value.get(normalize_name(value))
+        return {code} if code else self.in_text(value)
+
+
+def target_countries() -> List[Dict[str, Any]]:
+    if not ATHLETE_COUNTRIES:
+        return TARGET_COUNTRIES
+    unknown = set(ATHLETE_COUNTRIES) - {c["code"] for c in TARGET_COUNTRIES}
+    if unknown:
+        print(f"⚠️ ATHLETE_COUNTRIES has unknown code(s) {sorted(unknown)}; known: {[c['code'] for c in TARGET_COUNTRIES]}")
+    return [c for c in TARGET_COUNTRIES if c["code"] in ATHLETE_COUNTRIES]
+
+def classifier_signatures(countries: List[Dict[str, Any]]) -> Set[str]:
+    """
+    One "CODE:hash" token per country, hashed over what the matcher uses
+    (name, aliases, ISO codes). Stored on cached rosters/leagues, so content
+    that was already classified is only skipped for the same countries.
+    """
+    return {
+        f"{c['code']}:" + hashlib.sha1(json.dumps(
+            [c["name"], sorted(c.get("aliases", [])), sorted(c.get("iso", []))], ensure_ascii=False
+        ).encode("utf-8")).hexdigest()[:8]
+        for c in countries
+    }
+
+COUNTRIES = target_countries()
+COUNTRY_NAMES = {c["code"]: c["name"] for c in COUNTRIES}
+MATCHER = CountryMatcher(COUNTRIES)
+CLASSIFIED = classifier_signatures(COUNTRIES)
+
+def already_classified(previous: Optional[Dict[str, Any]], digest: str) -> Set[str]:
+    """Signatures the cached entry was classified for, if its content hash still matches (else none)."""
+    if not previous or previous.get("hash") != digest:
+        return set()
+    return set(previous.get("classified") or [])
+
+def countries_bdb(rec: Dict[str, Any], birthplace_field: str) -> Set[str]:
+    found = MATCHER.in_text(rec.get(birthplace_field))
     for k in ("country", "nationality", "citizenship", "country_code"):
-        v = rec.get(k)
-        if isinstance(v, str):
-            s = v.strip().lower()
-            if s == "venezuela" or s == "ven" or "venezuela" in s:
-                return True
-    return False
-
-def is_venezuelan_tsdb_player(player: Dict[str, Any]) -> bool:
-    nat = (player.get("strNationality") or "").strip().lower()
-    if nat == "venezuela":
-        return True
-    if contains_venezuela(player.get("strBirthLocation")):
-        return True
-    if contains_venezuela(player.get("strBirthPlace")):
-        return True
-    return False
-
-def is_venezuelan_tsdb_team_as_player(team_obj: Dict[str, Any]) -> bool:
-    c = (team_obj.get("strCountry") or "").strip().lower()
-    if c == "venezuela":
-        return True
-    if contains_venezuela(team_obj.get("strTeam")):
-        return True
-    return False
+        found |= MATCHER.in_value(rec.get(k))
+    return found
+
+def countries_tsdb_player(player: Dict[str, Any]) -> Set[str]:
+    return (
+        MATCHER.in_value(player.get("strNationality"))
+        | MATCHER.in_text(player.get("strBirthLocation"))
+        | MATCHER.in_text(player.get("strBirthPlace"))
+    )
+
+def countries_tsdb_team_as_player(team_obj: Dict[str, Any]) -> Set[str]:
+    return MATCHER.in_value(team_obj.get("strCountry")) | MATCHER.in_text(team_obj.get("strTeam"))
 
 def normalize_name_bdb(rec: Dict[str, Any]) -> str:
     fn = (rec.get("first_name") or "").strip()
@@ -197,6 +326,210 @@ def normalize_team_bdb(rec: Dict[str, Any]) -> str:
         return team.get("full_name") or team.get("name") or "Unknown"
     return rec.get("team_name") or rec.get("club") or "Unknown"
 
+# =========================
+# HTTP CLIENTS (one pooled session + rate limiter per provider)
+# =========================
+
+class RequestBudgetExhausted(Exception):
+    """Raised by RateLimiter.acquire() once the provider's request budget is spent."""
+
+
+class RateLimiter:
+    """
+    Thread-safe request spacing shared by every worker: at most one request
+    per `interval` seconds overall, however many threads are scanning.
+
+    pause() (a 429) holds back every worker, not just the one that was
+    throttled. `requests` counts acquired slots (retries included); once it
+    reaches `budget`, acquire() raises RequestBudgetExhausted.
+    """
+
+    def __init__(self, interval: float, budget: Optional[int] = None):
+        self.interval = interval
+        self.budget = budget
+        self.requests = 0
+        self.waited = 0.0
+        self.next_at = 0.0
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                if self.exhausted():
+                    raise RequestBudgetExhausted(f"request budget of {self.budget} spent")
+                now = time.monotonic()
+                at = max(now, self.next_at, self.paused_until)
+                self.next_at = at + self.interval
+            if at > now:
+                time.sleep(at - now)
+            # A 429 seen while this worker waited for its slot moves everyone back
+            with self._lock:
+                self.waited += max(0.0, at - now)
+                if self.exhausted():
+                    raise RequestBudgetExhausted(f"request budget of {self.budget} spent")
+                if time.monotonic() >= self.paused_until:
+                    self.requests += 1
+                    return
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            until = time.monotonic() + seconds
+            self.paused_until = max(self.paused_until, until)
+            self.next_at = max(self.next_at, self.paused_until)
+
+    def set_interval(self, interval: float) -> None:
+        with self._lock:
+            self.next_at += interval - self.interval
+            self.interval = interval
+
+    def exhausted(self) -> bool:
+        return self.budget is not None and self.requests >= self.budget
+
+
+def retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Retry-After header in seconds (numeric form only), else None."""
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+def rate_limit_window(resp: requests.Response) -> Optional[Tuple[int, float]]:
+    """
+    (requests remaining, seconds until the window resets) from X-RateLimit-* /
+    RateLimit-* headers, else None. A reset given as a unix timestamp is
+    converted to seconds from now.
+    """
+    for prefix in ("X-RateLimit-", "RateLimit-"):
+        remaining = resp.headers.get(prefix + "Remaining")
+        reset = resp.headers.get(prefix + "Reset")
+        if remaining is None or reset is None:
+            continue
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return None
+        if reset > 1e9:
+            reset -= time.time()
+        return remaining, max(0.0, reset)
+    return None
+
+
+class ProviderClient:
+    """
+    One provider's HTTP side: a pooled, keep-alive requests.Session (gzip is
+    negotiated once per connection, TLS handshakes are reused) behind the
+    provider's own RateLimiter, plus per-endpoint telemetry.
+
+    The limiter starts at `interval`. When responses carry rate-limit headers
+    the spacing is re-derived from them (remaining quota spread over the time
+    left in the window, never below `min_interval`), and a 429 pauses every
+    worker for Retry-After, or `fallback` seconds when the header is absent.
+    """
+
+    def __init__(self, name: str, base: Optional[str], interval: float, min_interval: float,
+                 headers: Optional[Dict[str, str]] = None, budget: Optional[int] = None, pool_size: int = 1):
+        self.name = name
+        self.base = base
+        self.min_interval = min_interval
+        self.limiter = RateLimiter(interval, budget)
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Rate-limited GET of base + path. Raises RequestBudgetExhausted once the
+        budget is spent, otherwise what requests raises; the status is the caller's.
+        """
+        self.limiter.acquire()
+        started = time.monotonic()
+        try:
+            resp = self.session.get(f"{self.base}{path}", params=params, timeout=REQUEST_TIMEOUT)
+        except Exception:
+            self._record(path, None, started, 0)
+            raise
+        self._record(path, resp.status_code, started, len(resp.content))
+
+        window = rate_limit_window(resp)
+        if window and resp.status_code != 429:
+            remaining, reset = window
+            if remaining <= 0:
+                self.limiter.pause(reset)
+            else:
+                self.limiter.set_interval(max(self.min_interval, reset / remaining))
+        return resp
+
+    def throttle(self, resp: requests.Response, fallback: float) -> float:
+        """Pause every worker after a 429; returns the pause in seconds."""
+        wait = retry_after_seconds(resp)
+        if wait is None:
+            window = rate_limit_window(resp)
+            wait = window[1] if window and window[1] > 0 else fallback
+        self.limiter.pause(wait)
+        return wait
+
+    def _record(self, path: str, status: Optional[int], started: float, size: int) -> None:
+        elapsed = time.monotonic() - started
+        with self._lock:
+            ep = self.endpoints.setdefault(path, {
+                "requests": 0, "ok": 0, "throttled": 0, "errors": 0, "seconds": 0.0, "bytes": 0,
+            })
+            ep["requests"] += 1
+            ep["seconds"] += elapsed
+            ep["bytes"] += size
+            if status is not None and 200 <= status < 300:
+                ep["ok"] += 1
+            elif status == 429:
+                ep["throttled"] += 1
+            else:
+                ep["errors"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {
+                path: {**ep, "seconds": round(ep["seconds"], 2),
+                       "avgMs": round(ep["seconds"] * 1000 / ep["requests"]) if ep["requests"] else None}
+                for path, ep in sorted(self.endpoints.items())
+            }
+        return {
+            "requests": sum(ep["requests"] for ep in endpoints.values()),
+            "waitedSec": round(self.limiter.waited, 1),
+            "intervalSec": round(self.limiter.interval, 2),
+            "endpoints": endpoints,
+        }
+
+
+BDB = ProviderClient("balldontlie", BDB_BASE, BDB_SLEEP_SEC, BDB_MIN_INTERVAL_SEC, headers=BDB_HEADERS)
+TSDB = ProviderClient("thesportsdb", f"{TSDB_BASE}/" if TSDB_BASE else None, TSDB_SLEEP_SEC, TSDB_MIN_INTERVAL_SEC,
+                      budget=TSDB_REQUEST_BUDGET, pool_size=TSDB_WORKERS)
+
+def save_metrics(clients: List[ProviderClient], started_at: datetime) -> None:
+    """Print a per-endpoint summary and prepend this run to METRICS_PATH (last METRICS_HISTORY runs)."""
+    run = {
+        "at": started_at.isoformat(),
+        "durationSec": round((datetime.now(timezone.utc) - started_at).total_seconds(), 1),
+        "providers": {c.name: c.summary() for c in clients},
+    }
+    for name, p in run["providers"].items():
+        print(f"📊 {name}: {p['requests']} request(s), {p['waitedSec']}s waiting on the limiter, spacing {p['intervalSec']}s")
+        for path, ep in p["endpoints"].items():
+            print(f"   {path}: {ep['ok']}/{ep['requests']} ok, {ep['throttled']} throttled, avg {ep['avgMs']} ms")
+
+    runs = []
+    if os.path.exists(METRICS_PATH):
+        try:
+            with open(METRICS_PATH, "r", encoding="utf-8") as f:
+                runs = json.load(f).get("runs", [])
+        except Exception:
+            pass
+    runs = [run] + runs[: METRICS_HISTORY - 1]
+    atomic_write_json(METRICS_PATH, {"_meta": {"updatedAt": run["at"], "runs": len(runs)}, "lastRun": run, "runs": runs})
+
 # =========================
 # TSDB REQUEST (backoff on 429) + SUCCESS FLAG
 # =========================
@@ -210,17 +543,15 @@ def tsdb_get_json_with_ok(path: str, params: Dict[str, Any]) -> Tuple[Optional[D
     if not TSDB_BASE:
         return None, False
 
-    url = f"{TSDB_BASE}/{path}"
     backoff = TSDB_BACKOFF_START
 
     for attempt in range(TSDB_MAX_RETRIES):
         try:
-            r = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            r = TSDB.get(path, params)
 
             if r.status_code == 429:
-                wait = min(60.0, backoff)
-                print(f"⚠️ TSDB 429 on {path} {params}. Sleeping {wait:.1f}s (attempt {attempt+1}/{TSDB_MAX_RETRIES})...")
-                time.sleep(wait)
+                wait = TSDB.throttle(r, min(60.0, backoff))
+                print(f"⚠️ TSDB 429 on {path} {params}. Pausing all workers {wait:.1f}s (attempt {attempt+1}/{TSDB_MAX_RETRIES})...")
                 backoff *= 2
                 continue
 
@@ -230,6 +561,8 @@ def tsdb_get_json_with_ok(path: str, params: Dict[str, Any]) -> Tuple[Optional[D
         except requests.HTTPError as e:
             print(f"❌ TSDB HTTP error {path} params={params}: {e}")
             return None, False
+        except RequestBudgetExhausted:
+            return None, False
         except Exception as e:
             wait = min(20.0, backoff)
             print(f"❌ TSDB error {path} params={params}: {e} (sleep {wait:.1f}s)")
@@ -264,14 +597,22 @@ def tsdb_lookupleague_name(league_id: str) -> Optional[str]:
 # SCANNERS
 # =========================
 
-def scan_balldontlie(entry: Dict[str, Any], out: List[Dict[str, Any]], seen: set) -> None:
-    cursor = None
-    pages = 0
+def scan_balldontlie(entry: Dict[str, Any], index: "DiscoveryIndex", cursors: Dict[str, Any]) -> None:
+    """
+    Read up to BDB_MAX_PAGES_PER_ENDPOINT pages of one endpoint, starting at
+    its saved checkpoint. The checkpoint advances (and is saved) after every
+    page, so an error or the page cap leaves the next run exactly where this
+    one stopped; the last page of a sweep resets it to page one.
+    """
     path = entry["path"]
+    checkpoint = cursors.setdefault(path, {"cursor": None, "pages": 0, "sweeps": 0})
+    cursor = checkpoint.get("cursor")
+    pages = 0
     birthplace_field = entry.get("field", "birth_place")
     active_field = entry.get("active_field")
 
-    print(f"🚀 Scanning (BDB) {entry['sport']} - {entry['league']} ... {path}")
+    resume = f" (resuming at cursor {cursor}, page {checkpoint.get('pages', 0) + 1})" if cursor else ""
+    print(f"🚀 Scanning (BDB) {entry['sport']} - {entry['league']} ... {path}{resume}")
 
     while True:
         if BDB_MAX_PAGES_PER_ENDPOINT is not None and pages >= BDB_MAX_PAGES_PER_ENDPOINT:
@@ -282,11 +623,11 @@ def scan_balldontlie(entry: Dict[str, Any], out: List[Dict[str, Any]], seen: set
             params["cursor"] = cursor
 
         try:
-            resp = requests.get(f"{BDB_BASE}{path}", headers=BDB_HEADERS, params=params, timeout=REQUEST_TIMEOUT)
+            resp = BDB.get(path, params)
 
             if resp.status_code == 429:
-                print("⚠️ BDB rate limit reached. Sleeping 60s...")
-                time.sleep(60)
+                wait = BDB.throttle(resp, BDB_429_PAUSE_SEC)
+                print(f"⚠️ BDB rate limit reached. Pausing {wait:.0f}s...")
                 continue
 
             if resp.status_code in (401, 403):
@@ -297,6 +638,12 @@ def scan_balldontlie(entry: Dict[str, Any], out: List[Dict[str, Any]], seen: set
             data = resp.json()
         except Exception as e:
             print(f"❌ Error in BDB {entry['league']}: {e}")
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if cursor and status in (400, 404, 422):
+                # The provider no longer accepts this cursor: start the sweep over next run
+                print(f"   ↩️ Dropping checkpoint for {path}; next run restarts from page one.")
+                checkpoint.update({"cursor": None, "pages": 0})
+                save_bdb_cursors(cursors)
             return
 
         players = data.get("data", []) or []
@@ -305,192 +652,304 @@ def scan_balldontlie(entry: Dict[str, Any], out: List[Dict[str, Any]], seen: set
             if active_field and p.get(active_field) is not True:
                 continue
 
-            if is_venezuelan_bdb(p, birthplace_field):
+            for country in countries_bdb(p, birthplace_field):
                 name = normalize_name_bdb(p)
-                key = f"balldontlie::{entry['league']}::{name}::{normalize_team_bdb(p)}"
-                if key in seen:
-                    continue
-
-                out.append({
+                index.add(country, {
                     "name": name,
                     "sport": entry["sport"],
                     "league": entry["league"],
                     "team": normalize_team_bdb(p),
                     "provider": "balldontlie",
                 })
-                seen.add(key)
 
         cursor = (data.get("meta") or {}).get("next_cursor")
         pages += 1
+        now = datetime.now(timezone.utc).isoformat()
+        checkpoint["updatedAt"] = now
+        if cursor:
+            checkpoint["cursor"] = cursor
+            checkpoint["pages"] = checkpoint.get("pages", 0) + 1
+        else:
+            print(f"   ✅ Sweep of {path} complete ({checkpoint.get('pages', 0) + 1} pages); next run starts over.")
+            checkpoint.update({
+                "cursor": None,
+                "pages": 0,
+                "sweeps": checkpoint.get("sweeps", 0) + 1,
+                "lastSweepAt": now,
+            })
+        save_bdb_cursors(cursors)
         if not cursor:
             break
 
-        time.sleep(BDB_SLEEP_SEC)
+    if cursor:
+        print(f"   ⏸️ Page cap reached after {pages} page(s); checkpoint saved at page {checkpoint['pages'] + 1}.")
 
-def scan_tsdb_top_division(
-    division: Dict[str, Any],
-    out: List[Dict[str, Any]],
-    seen: set,
+def content_hash(items: List[Dict[str, Any]]) -> str:
+    """Order-insensitive sha1 of an API list, so a re-fetched roster can be compared to the cached one."""
+    rows = sorted(json.dumps(item, sort_keys=True, ensure_ascii=False) for item in items)
+    return hashlib.sha1("\n".join(rows).encode("utf-8")).hexdigest()
+
+def roster_ttl(team_id: str) -> int:
+    """TSDB_ROSTER_TTL_SEC spread ±25% by team id, so a batch scanned together doesn't expire together."""
+    spread = int(hashlib.sha1(team_id.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+    return int(TSDB_ROSTER_TTL_SEC * (0.75 + 0.5 * spread))
+
+def tsdb_load_league(
+    league_id: str, fallback_name: str, cached: Optional[Dict[str, Any]], now: int
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Worker: league name + team list as a cache entry. Served from `cached`
+    while it is younger than TSDB_LEAGUE_TTL_SEC; if a refresh fails, the
+    stale entry is used. Returns (entry, fetched) — entry is None on failure
+    with nothing cached.
+    """
+    if cached and now - int(cached.get("fetchedAt", 0) or 0) < TSDB_LEAGUE_TTL_SEC:
+        return cached, False
+
+    teams, ok = tsdb_lookup_teams_by_league_id(league_id)
+    if not ok:
+        return cached, False
+    name = tsdb_lookupleague_name(league_id) or (cached or {}).get("name") or fallback_name
+    slim = [
+        {"idTeam": str(t.get("idTeam") or "").strip(), "strTeam": t.get("strTeam"), "strCountry": t.get("strCountry")}
+        for t in teams
+    ]
+    return {"name": name, "teams": slim, "hash": content_hash(slim), "fetchedAt": now}, True
+
+def scan_tsdb_divisions(
+    divisions: List[Dict[str, Any]],
+    index: "DiscoveryIndex",
     cache: Dict[str, Any],
 ) -> None:
+    """
+    Scan every configured division with TSDB_WORKERS threads under the shared
+    TSDB client's limiter. League metadata comes from the cache while fresh.
+    Due rosters are never-scanned teams (queued round-robin across leagues, so
+    a budget-limited run covers each league a little) followed by expired
+    ones and ones not yet classified for every target country, oldest first. A re-fetched roster whose hash is unchanged is not
+    filtered or merged again, unless it was classified for other countries.
+    """
     if not TSDB_BASE:
         print("⚠️ SPORTSDB_KEY missing. Skipping TSDB.")
         return
-
-    league_id = division["league_id"]
-    league_label = division["league"]
-    sport = division["sport"]
-    country = division["country"]
-
-    resolved = tsdb_lookupleague_name(league_id) or league_label
-    print(f"🌎 Scanning (TSDB) {sport} TOP DIVISION in {country}: {resolved} (id={league_id}) ...")
-
-    teams, teams_ok = tsdb_lookup_teams_by_league_id(league_id)
-    time.sleep(TSDB_SLEEP_SEC)
-
-    if not teams_ok:
-        print(f"   ⚠️ TSDB teams fetch failed for league_id={league_id} ({resolved}). Will retry next run.")
-        return
-
-    if not teams:
-        print(f"   ⚠️ No teams found for league_id={league_id} ({resolved}).")
+    if not divisions:
         return
 
-    scanned_team_ids = set(str(x) for x in (cache.get("scanned_team_ids") or []))
-    team_next_retry = cache.get("team_next_retry") or {}
+    rosters = cache["rosters"]
+    leagues = cache["leagues"]
+    team_next_retry = cache["team_next_retry"]
     now = int(time.time())
 
-    new_attempts = 0
-    for t in teams:
-        if new_attempts >= TSDB_MAX_TEAMS_PER_LEAGUE:
-            break
-
-        team_id_raw = t.get("idTeam")
-        team_name = (t.get("strTeam") or "Unknown").strip()
-        if not team_id_raw:
-            continue
-
-        team_id = str(team_id_raw).strip()
-
-        # already successfully scanned in a prior run
-        if team_id in scanned_team_ids:
-            continue
-
-        # cooldown if previously failed
-        next_ok = int(team_next_retry.get(team_id, 0) or 0)
-        if next_ok and now < next_ok:
-            continue
-
-        players, ok = tsdb_lookup_all_players(team_id)
-        time.sleep(TSDB_SLEEP_SEC)
-
-        new_attempts += 1
-
-        if not ok:
-            # IMPORTANT FIX:
-            # Do NOT mark scanned on failure. Just set a cooldown so we don't hammer.
-            team_next_retry[team_id] = now + TSDB_TEAM_RETRY_COOLDOWN_SEC
-            continue
-
-        # SUCCESS:
-        # Mark scanned even if roster is empty (that's a real "done" state).
-        scanned_team_ids.add(team_id)
-        if team_id in team_next_retry:
-            team_next_retry.pop(team_id, None)
-
-        if not players:
-            continue
+    with ThreadPoolExecutor(max_workers=TSDB_WORKERS) as pool:
+        loaded = list(pool.map(
+            lambda d: tsdb_load_league(d["league_id"], d["league"], leagues.get(d["league_id"]), now),
+            divisions,
+        ))
+
+        queues, stale = [], []
+        for division, (league, fetched) in zip(divisions, loaded):
+            league_id = division["league_id"]
+            if league is None:
+                print(f"   ⚠️ TSDB teams fetch failed for league_id={league_id} ({division['league']}). Will retry next run.")
+                continue
+            leagues[league_id] = league
+            resolved = league["name"]
+            source = "fetched" if fetched else "cached"
+            print(f"🌎 Scanning (TSDB) {division['sport']} TOP DIVISION in {division['country']}: {resolved} (id={league_id}, {source}) ...")
+
+            teams = league["teams"]
+            if not teams:
+                print(f"   ⚠️ No teams found for league_id={league_id} ({resolved}).")
+                continue
 
-        for p in players:
-            if is_venezuelan_tsdb_player(p):
-                name = (p.get("strPlayer") or "").strip() or "Unknown"
-                key = f"thesportsdb::{resolved}::{name}::{team_id}"
-                if key in seen:
+            new = deque()
+            for t in teams:
+                team_id = t["idTeam"]
+                if not team_id:
                     continue
+                # cooldown if previously failed
+                next_ok = int(team_next_retry.get(team_id, 0) or 0)
+                if next_ok and now < next_ok:
+                    continue
+                job = (division, resolved, team_id, (t.get("strTeam") or "Unknown").strip())
+                cached = rosters.get(team_id)
+                if cached is None:
+                    new.append(job)
+                elif (now - int(cached.get("fetchedAt", 0) or 0) >= roster_ttl(team_id)
+                      or not CLASSIFIED <= set(cached.get("classified") or [])):
+                    stale.append(job)
+            print(f"   {len(teams)} teams: {len(new)} never scanned")
+            if new:
+                queues.append(new)
+
+        jobs = []
+        while queues:
+            for q in list(queues):
+                jobs.append(q.popleft())
+                if not q:
+                    queues.remove(q)
+        stale.sort(key=lambda job: int(rosters[job[2]].get("fetchedAt", 0) or 0))
+        jobs += stale
+
+        remaining = max(0, TSDB_REQUEST_BUDGET - TSDB.limiter.requests)
+        if len(jobs) > remaining:
+            print(f"   ⏳ Request budget covers {remaining} of {len(jobs)} due rosters this run; the rest carry over.")
+            jobs = jobs[:remaining]
+
+        unchanged = carried = 0
+        futures = {pool.submit(tsdb_lookup_all_players, job[2]): job for job in jobs}
+        for fut in as_completed(futures):
+            division, resolved, team_id, team_name = futures[fut]
+            players, ok = fut.result()
+
+            if not ok and TSDB.limiter.exhausted():
+                # Retries used up the budget before this roster: still due next run, no cooldown
+                carried += 1
+                continue
+            if not ok:
+                # IMPORTANT FIX:
+                # Do NOT mark scanned on failure. Just set a cooldown so we don't hammer.
+                team_next_retry[team_id] = now + TSDB_TEAM_RETRY_COOLDOWN_SEC
+                continue
 
-                out.append({
-                    "name": name,
-                    "sport": sport,
-                    "league": resolved,
-                    "team": team_name,
-                    "provider": "thesportsdb",
-                    "country_context": country,
-                    "nationality": p.get("strNationality"),
-                    "birth_location": p.get("strBirthLocation") or p.get("strBirthPlace"),
-                })
-                seen.add(key)
-
-    # write back into cache dict (caller saves once)
-    cache["scanned_team_ids"] = sorted(scanned_team_ids)
-    cache["team_next_retry"] = team_next_retry
+            # SUCCESS:
+            # Record the roster even if it is empty (that's a real "done" state).
+            team_next_retry.pop(team_id, None)
+            digest = content_hash(players)
+            classified = already_classified(rosters.get(team_id), digest)
+            rosters[team_id] = {
+                "hash": digest, "fetchedAt": now, "players": len(players),
+                "classified": sorted(classified | CLASSIFIED),
+            }
+            if CLASSIFIED <= classified:
+                unchanged += 1
+                continue
 
-def scan_tsdb_golf(out: List[Dict[str, Any]], seen: set) -> None:
+            for p in players:
+                for country in countries_tsdb_player(p):
+                    name = (p.get("strPlayer") or "").strip() or "Unknown"
+                    index.add(country, {
+                        "name": name,
+                        "sport": division["sport"],
+                        "league": resolved,
+                        "team": team_name,
+                        "provider": "thesportsdb",
+                        "country_context": division["country"],
+                        "nationality": p.get("strNationality"),
+                        "birth_location": p.get("strBirthLocation") or p.get("strBirthPlace"),
+                    })
+
+    print(f"   ✅ TSDB rosters: {len(jobs) - carried} requested ({unchanged} unchanged, {carried} carried over), "
+          f"{TSDB.limiter.requests} request(s) used of {TSDB_REQUEST_BUDGET}")
+
+def scan_tsdb_golf(index: "DiscoveryIndex", cache: Dict[str, Any]) -> None:
     if not TSDB_BASE:
         return
 
-    print("🏌️ Scanning (TSDB) Golf → Tours → (Teams-as-golfers) → filter Venezuelans ...")
+    print(f"🏌️ Scanning (TSDB) Golf → Tours → (Teams-as-golfers) → filter {', '.join(COUNTRY_NAMES.values())} ...")
 
+    leagues = cache["leagues"]
+    now = int(time.time())
     for tour in TSDB_GOLF_TOP_TOURS:
         league_id = tour["league_id"]
-        league_name = tsdb_lookupleague_name(league_id) or tour.get("league", f"Golf Tour {league_id}")
+        previous = leagues.get(league_id)
+        league, fetched = tsdb_load_league(league_id, tour.get("league", f"Golf Tour {league_id}"), previous, now)
 
-        teams, ok = tsdb_lookup_teams_by_league_id(league_id)
-        time.sleep(TSDB_SLEEP_SEC)
-
-        if not ok or not teams:
+        if league is None or not league["teams"]:
+            continue
+        classified = already_classified(previous, league["hash"])
+        leagues[league_id] = {**league, "classified": sorted(classified | CLASSIFIED)}
+        # Same golfer list, already classified for every target country: nothing new to find
+        if CLASSIFIED <= classified:
+            print(f"   ⏭️ {league['name']}: {'unchanged' if fetched else 'cached'}, skipped")
             continue
 
-        for golfer in teams:
-            if is_venezuelan_tsdb_team_as_player(golfer):
+        league_name = league["name"]
+        for golfer in league["teams"]:
+            for country in countries_tsdb_team_as_player(golfer):
                 name = (golfer.get("strTeam") or "Unknown").strip()
-                key = f"thesportsdb::{league_name}::{name}::golfteam"
-                if key in seen:
-                    continue
-
-                out.append({
+                index.add(country, {
                     "name": name,
                     "sport": "Golf",
                     "league": league_name,
-                    "team": "Venezuela",
+                    "team": COUNTRY_NAMES[country],
                     "provider": "thesportsdb",
                     "nationality": golfer.get("strCountry"),
                 })
-                seen.add(key)
 
 # =========================
 # MAIN
 # =========================
 
-def fetch_all_venezuelans() -> List[Dict[str, Any]]:
-    out = load_existing_athletes()
-
-    # De-dupe across runs (provider+league+name+team)
-    seen = set()
-    for a in out:
-        key = f"{a.get('provider','?')}::{a.get('league','?')}::{a.get('name','?')}::{a.get('team','?')}"
-        seen.add(key)
-
-    # BallDontLie scan
+def discover_balldontlie(index: DiscoveryIndex) -> None:
+    # BallDontLie scan (resumes each endpoint from its checkpoint)
+    cursors = load_bdb_cursors()
     for ep in BDB_ENDPOINTS:
-        scan_balldontlie(ep, out, seen)
+        scan_balldontlie(ep, index, cursors)
 
+def discover_thesportsdb(index: DiscoveryIndex) -> None:
     # TheSportsDB scan + cache
-    if TSDB_BASE:
-        cache = load_tsdb_cache()
-
-        for div in TSDB_TOP_DIVISIONS:
-            scan_tsdb_top_division(div, out, seen, cache)
+    if not TSDB_BASE:
+        return
+    cache = load_tsdb_cache()
+    try:
+        scan_tsdb_divisions(TSDB_TOP_DIVISIONS, index, cache)
 
+        # Optional TSDB golf
+        scan_tsdb_golf(index, cache)
+    finally:
         save_tsdb_cache(cache)
 
-        # Optional TSDB golf
-        scan_tsdb_golf(out, seen)
+def fetch_all_athletes(registry: AthleteRegistry) -> Dict[str, int]:
+    """
+    Run each provider's discovery on its own thread. The quotas are separate
+    (each ProviderClient has its own limiter), so discovery takes as long as
+    the slower provider instead of the sum of both. Every roster is
+    classified for all COUNTRIES; new athletes are registered (buffered) in
+    `registry`. Returns {country code: new athletes}.
+    """
+    index = DiscoveryIndex(registry)
+
+    def timed(name, discover):
+        started = time.monotonic()
+        discover(index)
+        print(f"⏱️ {name} discovery finished in {time.monotonic() - started:.0f}s")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(timed, "balldontlie", discover_balldontlie),
+            pool.submit(timed, "thesportsdb", discover_thesportsdb),
+        ]
+        for fut in futures:
+            fut.result()
 
-    out.sort(key=lambda x: (x.get("sport", ""), x.get("league", ""), x.get("name", "")))
-    return out
+    for code, added in index.added.items():
+        print(f"🧮 {COUNTRY_NAMES[code]}: {added} new athlete(s) discovered")
+    return index.added
 
 if __name__ == "__main__":
     os.makedirs("data", exist_ok=True)
-    vzla_list = fetch_all_venezuelans()
-    save_athletes(vzla_list)
-    print(f"🏁 Finished! Total unique athletes in database: {len(vzla_list)}")
+    started_at = datetime.now(timezone.utc)
+
+    registry = AthleteRegistry.load(REGISTRY_PATH)
+    if registry.rekeyed or registry.dropped:
+        # One-off: lines written under the old team-id / "golfteam" keys
+        print(f"🔁 Re-keyed {registry.rekeyed} registry line(s), dropped {registry.dropped} duplicate(s)")
+        registry.rewrite()
+    for country in COUNTRIES:
+        if not registry.knows(country["code"]):
+            # First run with the registry: the existing snapshot is the starting point
+            registry.bootstrap(country["code"], country["file"])
+
+    fetch_all_athletes(registry)
+    print(f"📒 {registry.flush()} line(s) appended to {REGISTRY_PATH}")
+
+    # Snapshots are only rewritten when the registry adds something to them
+    for country in COUNTRIES:
+        added = compact(registry, country["code"], country["file"])
+        print(f"🗜️ {country['file']}: +{added} athlete(s)" if added else f"💤 {country['file']}: unchanged, not rewritten")
+    registry.flush()
+
+    save_metrics([BDB, TSDB], started_at)
+    totals = ", ".join(f"{c['name']} {len(registry.keys.get(c['code'], ()))}" for c in COUNTRIES)
+    print(f"🏁 Finished! Registered athletes: {totals}")
@@ -1,22 +1,107 @@
 #!/usr/bin/env python3
 """
-Scrape gemrate.com for Venezuelan athletes' PSA graded-card stats.
+Scrape gemrate.com for Venezuelan athletes' graded-card stats.
 Runs in batches (like ebay-sold-avg) with progress tracking.
-Queries PSA grader only for each athlete found in data/athletes.json.
-Outputs data/gemrate.json with per-athlete PSA totals.
+Visits each athlete found in data/athletes.json once and queries every grader
+in GRADERS (PSA, SGC, Beckett) inside the same warm session.
+Outputs data/gemrate.json (PSA), data/gemrate_sgc.json (SGC) and
+data/gemrate_beckett.json (Beckett) from one shared progress cursor.
+
+Usage:
+  python scripts/fetch_gemrate.py                    # sequential, random polite delays
+  python scripts/fetch_gemrate.py --async            # overlapped requests under a token bucket
+  python scripts/fetch_gemrate.py --async --rpm 13 --concurrency 3 --batch-size 40
+  python scripts/fetch_gemrate.py --schedule priority   # stalest / most active athletes first
+  python scripts/fetch_gemrate.py --minify-public       # compact public/data copies
+  python scripts/fetch_gemrate.py --persist-session     # reuse cookies + sticky User-Agent across runs
+  python scripts/fetch_gemrate.py --shard 0/4           # one of 4 workers; merge with merge_gemrate_shards.py
+  python scripts/fetch_gemrate.py --only "Ronald Acuña Jr., Gleyber Torres"   # refresh just these, now
+  python scripts/fetch_gemrate.py --only-file names.txt  # one name per line (GEMRATE_ONLY env works too)
+  python scripts/fetch_gemrate.py --no-archive          # skip the raw-page archive (gemrate_archive.py)
 """
 
-import json, os, re, time, sys, random
-import html
+import argparse, asyncio, json, os, re, time, sys, random
+import copy, hashlib, heapq, html, math
+from datetime import datetime, timedelta, timezone
 import requests
 
-GEMRATE_URL = "https://www.gemrate.com/player"
+from atomic_write import atomic_write_bytes, atomic_write_json
+from dedupe_athletes import normalize_name
+from gemrate_archive import ARCHIVE_DIR, RawArchive
+from gemrate_events import EVENTS_FILE, EventFeed, diff_record
+from gemrate_history import HISTORY_FILE, GemrateHistory
+
+# GEMRATE_URL can point at the offline stand-in (scripts/bench_gemrate.py --serve)
+GEMRATE_URL = os.environ.get("GEMRATE_URL", "https://www.gemrate.com/player")
+
+BATCH_SIZE = 20  # athletes per run (without --time-budget / --request-budget)
+
+# Budgeted runs (--time-budget / --request-budget) keep taking athletes from the
+# queue until a budget runs out. Every run also stops starting new athletes once
+# more than BUDGET_MAX_BLOCK_RATE of the last BUDGET_BLOCK_WINDOW requests were
+# blocked (Cloudflare page, 403 or 429).
+BUDGET_BLOCK_WINDOW = 12
+BUDGET_MAX_BLOCK_RATE = 0.5
+
+# Per-athlete scrape state (last fetch, grade totals, change rate, due date).
+# Updated by every run, whatever the schedule.
+STATE_FILE = "gemrate-state.json"
+
+# Per-athlete due dates (replace the old global 60-day cooldown).
+#   hit    -> at least one grader returned grades > 0
+#   zero   -> every grader answered, none with graded cards; TTL doubles per
+#             consecutive zero result up to DUE_TTL_ZERO_MAX_DAYS
+#   failed -> no grader hit and at least one returned nothing (HTTP error /
+#             block); TTL doubles per consecutive failure up to DUE_TTL_HIT_DAYS
+DUE_TTL_HIT_DAYS = 21
+DUE_TTL_ZERO_DAYS = 30
+DUE_TTL_ZERO_MAX_DAYS = 360
+DUE_TTL_FAILED_HOURS = 12
+
+# What a grader "answered" when its 200 page has no summary (no graded cards
+# for the player). None stays reserved for HTTP errors and blocks.
+NO_RESULTS = {"cards": 0, "gems": 0, "grades": 0, "gemRate": 0}
+
+# Append-only NDJSON journal, one line per finished athlete, fsync'd as soon
+# as the athlete is done. Replayed into the outputs/state on the next start,
+# so a cancelled or timed-out run never loses a request it already made.
+JOURNAL_FILE = "gemrate-journal.ndjson"
+
+# Rolling per-run telemetry summary (latency percentiles, block rate,
+# busy vs idle time, parse paths); keeps the last METRICS_HISTORY runs.
+METRICS_FILE = "gemrate-metrics.json"
+METRICS_HISTORY = 60
+
+# --shard K/N: athletes are split by a stable hash of their normalized name.
+# A shard keeps its own cursor, journal, metrics and session (SHARD_DIR,
+# .cache/) and never writes the shared outputs or state; its journal is the
+# partial result that scripts/merge_gemrate_shards.py folds into data/gemrate*.json.
+SHARD_DIR = "gemrate-shards"
+
+# --schedule priority: score = effective age in days, i.e.
+#   days_since_fetch * (1 + sum(weight * normalized_signal))
+# so an athlete with every signal maxed out is refreshed ~(1 + sum weights)x
+# as often as one with no graded cards and no eBay listings.
+PRIORITY_NEVER_FETCHED_DAYS = 365
+PRIORITY_WEIGHTS = {
+    "volume": 2.0,  # log total grades across graders
+    "change": 3.0,  # log grades added per day at the last refresh
+    "ebay": 1.0,    # log nListing from data/ebay-avg.json
+}
 
-BATCH_SIZE = 20  # athletes per run
+# Graders queried per athlete.
+#   key    -> label used in the output JSON ("graders": {key: stats})
+#   grader -> gemrate form value
+#   output -> file name under data/ and public/data/
+GRADERS = [
+    {"key": "PSA", "grader": "psa", "output": "gemrate.json"},
+    {"key": "SGC", "grader": "sgc", "output": "gemrate_sgc.json"},
+    {"key": "beckett", "grader": "bgs", "output": "gemrate_beckett.json"},
+]
 
-# --- cooldown config (added) ---
-COOLDOWN_DAYS = 60
-COOLDOWN_FILE = "gemrate-cooldown.json"
+# --persist-session: cookie jar + sticky User-Agent saved between runs.
+# Lives outside data/ (never committed); the workflow keeps it in actions/cache.
+SESSION_FILE = os.path.join(".cache", "gemrate-session.json")
 
 # Rotate realistic browser User-Agents to reduce Cloudflare blocks
 USER_AGENTS = [
@@ -27,13 +112,44 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
 ]
 
-# Polite delay range (seconds) between requests
+# Polite delay range (seconds) between athletes
 DELAY_MIN = 3
 DELAY_MAX = 6
 
+# Shorter delay range (seconds) between graders for the same athlete
+GRADER_DELAY_MIN = 1
+GRADER_DELAY_MAX = 2
+
 # Max retries per request
 MAX_RETRIES = 2
 
+# Adaptive pacing (Pacer), replacing the fixed per-attempt backoff ladder.
+# AIMD on requests/minute, in fractions of the configured rate (--rpm):
+# +PACE_INCREASE_RATIO per clean response up to the configured rate,
+# x PACE_BLOCK_DECREASE per block (Cloudflare page, 403, 429),
+# x PACE_ERROR_DECREASE per other failure, never below PACE_MIN_RATIO.
+# At 13 req/min that is +0.5 per success with a floor of ~1 req/min.
+# Sequential mode stretches its polite delays by (configured rpm / current rpm).
+PACE_MIN_RATIO = 0.08
+PACE_INCREASE_RATIO = 0.04
+PACE_BLOCK_DECREASE = 0.5
+PACE_ERROR_DECREASE = 0.8
+# Circuit breaker: PACE_BREAKER_BLOCKS consecutive blocks open it; after the
+# cooldown one probe request either closes it or reopens it with the cooldown
+# doubled (up to PACE_BREAKER_MAX_COOLDOWN_SEC).
+PACE_BREAKER_BLOCKS = 4
+PACE_BREAKER_COOLDOWN_SEC = 300
+PACE_BREAKER_MAX_COOLDOWN_SEC = 3600
+# Pace + breaker state carried to the next run (ignored once this old)
+PACER_FILE = "gemrate-pacer.json"
+PACER_STATE_MAX_AGE_HOURS = 24
+
+# --async mode: shared request budget instead of per-athlete sleeps.
+# 13 req/min matches the old one-grader-per-4.5s average pace.
+ASYNC_REQUESTS_PER_MINUTE = 13
+ASYNC_MAX_IN_FLIGHT = 3
+ASYNC_BURST = 1
+
 # Sport -> gemrate category mapping
 CAT_MAP = {
     "Baseball": "baseball-cards",
@@ -46,10 +162,10 @@ CAT_MAP = {
 }
 
 
-def get_headers():
-    """Return headers with a random User-Agent."""
+def get_headers(user_agent=None):
+    """Return headers with the given (sticky) User-Agent, or a random one."""
     return {
-        "User-Agent": random.choice(USER_AGENTS),
+        "User-Agent": user_agent or random.choice(USER_AGENTS),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
         "Accept-Encoding": "gzip, deflate, br",
@@ -61,135 +177,717 @@ def get_headers():
     }
 
 
-def in_cooldown(base_dir):
-    """Return True if within cooldown window."""
-    from datetime import datetime, timezone, timedelta
-
-    cooldown_path = os.path.join(base_dir, "data", COOLDOWN_FILE)
-
-    if not os.path.exists(cooldown_path):
-        return False
+# Summary labels: output key -> label as shown on the Gemrate player page
+SUMMARY_LABELS = (
+    ("cards", "# of Cards"),
+    ("gems", "Total Gems"),
+    ("grades", "Total Grades"),
+    ("gemRate", "Gem Rate"),
+)
+_LABEL_RES = {key: re.compile(re.escape(label), re.IGNORECASE) for key, label in SUMMARY_LABELS}
+
+# Value patterns, anchored right after a label occurrence
+# Pattern 1: legacy format (# of Cards<br><strong>123</strong>)
+_LEGACY_VALUE_RE = re.compile(r"\s*<br\s*/?>\s*<strong[^>]*>([\d,]+%?)</strong>", re.IGNORECASE)
+# Pattern 2: generic label -> value in nearby HTML nodes
+_NEARBY_VALUE_RE = re.compile(r"(?:\s|</[^>]+>|<[^>]+>)*?([\d,]+%?)")
+# Pattern 3: text-only fallback (robust against markup changes)
+_TEXT_VALUE_RE = re.compile(r"\s*([\d,]+%?)")
+
+_SCRIPT_STYLE_RE = re.compile(r"(?is)<script.*?>.*?</script>|<style.*?>.*?</style>")
+_BR_RE = re.compile(r"(?i)<br\s*/?>")
+_TAG_RE = re.compile(r"(?s)<[^>]+>")
+_HSPACE_RE = re.compile(r"[ \t]+")
+_NEWLINES_RE = re.compile(r"\n+")
+
+
+def _parse_numeric(raw: str):
+    val = raw.replace(",", "").strip()
+    if val.endswith("%"):
+        return float(val[:-1])
+    return int(val)
+
+
+def _html_to_text(html_content: str) -> str:
+    text = _SCRIPT_STYLE_RE.sub(" ", html_content)
+    text = _BR_RE.sub("\n", text)
+    text = _TAG_RE.sub("\n", text)
+    text = html.unescape(text)
+    text = _HSPACE_RE.sub(" ", text)
+    return _NEWLINES_RE.sub("\n", text)
+
+
+def _label_offsets(content: str, lower_content: str):
+    """
+    Return {key: [offset just past each label occurrence]} for all labels.
+    Uses plain str.find on the lowered copy; falls back to regex when lowering
+    changed the string length (offsets would not line up).
+    """
+    offsets = {}
+    same_len = len(lower_content) == len(content)
+    for key, label in SUMMARY_LABELS:
+        hits = []
+        if same_len:
+            needle = label.lower()
+            pos = lower_content.find(needle)
+            while pos != -1:
+                hits.append(pos + len(needle))
+                pos = lower_content.find(needle, pos + 1)
+        else:
+            hits = [m.end() for m in _LABEL_RES[key].finditer(content)]
+        offsets[key] = hits
+    return offsets
+
+
+def _scan_values(content: str, offsets: dict, value_re, found: dict):
+    """Fill `found` with the first value after each still-missing label."""
+    for key, _ in SUMMARY_LABELS:
+        if key in found:
+            continue
+        for end in offsets[key]:
+            m = value_re.match(content, end)
+            if m:
+                found[key] = _parse_numeric(m.group(1))
+                break
+
+
+def parse_summary_with_path(html_content: str):
+    """
+    parse_summary() that also reports which pattern was needed:
+    (result, path) with path in legacy / nearby / text / blocked / none.
+    """
+    lower_html = html_content.lower()
+    if "you have been blocked" in lower_html or "cf-error-details" in lower_html:
+        return "blocked", "blocked"
 
-    try:
-        with open(cooldown_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    if "summary" not in lower_html:
+        return None, "none"
 
-        completed_at = data.get("completedAt")
-        if not completed_at:
-            return False
+    # Locate every label once, then try each value pattern only at those
+    # offsets. The text-only copy is built at most once, and only when a
+    # label is still missing after the two HTML patterns.
+    found = {}
+    path = "legacy"
+    offsets = _label_offsets(html_content, lower_html)
+    _scan_values(html_content, offsets, _LEGACY_VALUE_RE, found)
+    if len(found) < len(SUMMARY_LABELS):
+        path = "nearby"
+        _scan_values(html_content, offsets, _NEARBY_VALUE_RE, found)
 
-        last_done = datetime.fromisoformat(completed_at)
-        if last_done.tzinfo is None:
-            last_done = last_done.replace(tzinfo=timezone.utc)
+    if len(found) < len(SUMMARY_LABELS):
+        path = "text"
+        text = _html_to_text(html_content)
+        _scan_values(text, _label_offsets(text, text.lower()), _TEXT_VALUE_RE, found)
 
-        return datetime.now(timezone.utc) < last_done + timedelta(days=COOLDOWN_DAYS)
+    if not found:
+        return None, "none"
 
-    except Exception:
-        return False
+    return {key: found.get(key, 0) for key, _ in SUMMARY_LABELS}, path
 
 
 def parse_summary(html_content: str):
     """Extract # of Cards, Total Gems, Total Grades, Gem Rate from Gemrate HTML."""
-    lower_html = html_content.lower()
-    if "you have been blocked" in lower_html or "cf-error-details" in lower_html:
-        return "blocked"
+    return parse_summary_with_path(html_content)[0]
 
-    if "summary" not in lower_html:
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list (None when empty)."""
+    if not values:
         return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
 
-    def parse_numeric(raw: str):
-        val = raw.replace(",", "").strip()
-        if val.endswith("%"):
-            return float(val[:-1])
-        return int(val)
-
-    def extract_stat(label: str):
-        # Pattern 1: legacy format (# of Cards<br><strong>123</strong>)
-        legacy = rf"{re.escape(label)}\s*<br\s*/?>\s*<strong[^>]*>([\d,]+%?)</strong>"
-        m = re.search(legacy, html_content, re.IGNORECASE)
-        if m:
-            return parse_numeric(m.group(1))
-
-        # Pattern 2: generic label -> value in nearby HTML nodes
-        nearby = rf"{re.escape(label)}(?:\s|</[^>]+>|<[^>]+>)*?([\d,]+%?)"
-        m = re.search(nearby, html_content, re.IGNORECASE)
-        if m:
-            return parse_numeric(m.group(1))
-
-        # Pattern 3: text-only fallback (robust against markup changes)
-        text = re.sub(r"(?is)<script.*?>.*?</script>|<style.*?>.*?</style>", " ", html_content)
-        text = re.sub(r"(?i)<br\s*/?>", "\n", text)
-        text = re.sub(r"(?s)<[^>]+>", "\n", text)
-        text = html.unescape(text)
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n+", "\n", text)
-
-        text_pattern = rf"{re.escape(label)}\s*([\d,]+%?)"
-        m = re.search(text_pattern, text, re.IGNORECASE)
-        if m:
-            return parse_numeric(m.group(1))
 
-        return None
+def is_blocked(r):
+    """One request counts as blocked on a 403/429 or a 200 challenge page (budget and metrics alike)."""
+    return r["parsePath"] == "blocked" or r["status"] in (403, 429)
 
-    cards = extract_stat("# of Cards")
-    gems = extract_stat("Total Gems")
-    grades = extract_stat("Total Grades")
-    gem_rate = extract_stat("Gem Rate")
 
-    if cards is None and gems is None and grades is None and gem_rate is None:
+def union_seconds(intervals):
+    """Length of the union of (start, end) intervals, so overlapping async waits count once."""
+    total, cur_start, cur_end = 0.0, None, None
+    for start, end in sorted(intervals):
+        if cur_end is None or start > cur_end:
+            if cur_end is not None:
+                total += cur_end - cur_start
+            cur_start, cur_end = start, end
+        else:
+            cur_end = max(cur_end, end)
+    if cur_end is not None:
+        total += cur_end - cur_start
+    return total
+
+
+class RunMetrics:
+    """Per-request telemetry for one run; summary() feeds METRICS_FILE."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = []
+        self.sleeps = []  # (start, end) perf_counter intervals
+
+    def request(self, grader, started, ended, status, size=0, attempt=0, parse_path=None):
+        self.requests.append({
+            "grader": grader,
+            "start": started,
+            "end": ended,
+            "status": status,
+            "bytes": size,
+            "attempt": attempt,
+            "parsePath": parse_path,
+        })
+
+    def slept(self, started, ended):
+        if ended > started:
+            self.sleeps.append((started, ended))
+
+    def busy_seconds(self):
+        """Wall time with at least one request in flight (union of request intervals)."""
+        return union_seconds((r["start"], r["end"]) for r in self.requests)
+
+    def sleep_seconds(self):
+        """Wall time with at least one worker waiting (union of sleep intervals)."""
+        return union_seconds(self.sleeps)
+
+    def summary(self):
+        wall = time.perf_counter() - self.started
+        latencies = [(r["end"] - r["start"]) * 1000 for r in self.requests]
+        n = len(self.requests)
+        blocked = sum(1 for r in self.requests if is_blocked(r))
+        errors = sum(1 for r in self.requests if r["status"] != 200)
+        paths, statuses = {}, {}
+        for r in self.requests:
+            statuses[str(r["status"])] = statuses.get(str(r["status"]), 0) + 1
+            if r["parsePath"]:
+                paths[r["parsePath"]] = paths.get(r["parsePath"], 0) + 1
+        busy = self.busy_seconds()
+
+        return {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "requests": n,
+            "retries": sum(1 for r in self.requests if r["attempt"] > 0),
+            "statuses": statuses,
+            "blocked": blocked,
+            "blockRate": round(blocked / n, 4) if n else 0.0,
+            "errorRate": round(errors / n, 4) if n else 0.0,
+            "bytes": sum(r["bytes"] for r in self.requests),
+            "latencyMs": {
+                "p50": round(percentile(latencies, 50), 1) if latencies else None,
+                "p95": round(percentile(latencies, 95), 1) if latencies else None,
+                "max": round(max(latencies), 1) if latencies else None,
+            },
+            "parsePaths": paths,
+            "wallSec": round(wall, 2),
+            "busySec": round(busy, 2),
+            "idleSec": round(max(wall - busy, 0.0), 2),
+            "sleepSec": round(self.sleep_seconds(), 2),
+            "busyPct": round(busy / wall * 100, 1) if wall else 0.0,
+        }
+
+
+def save_metrics(base_dir, summary):
+    """Prepend this run's summary to METRICS_FILE, keeping METRICS_HISTORY runs."""
+    metrics_path = os.path.join(base_dir, "data", METRICS_FILE)
+    runs = []
+    if os.path.exists(metrics_path):
+        try:
+            with open(metrics_path, "r", encoding="utf-8") as f:
+                runs = json.load(f).get("runs", [])
+        except Exception:
+            pass
+    runs = [summary] + runs[: METRICS_HISTORY - 1]
+
+    latencies = [r["latencyMs"]["p50"] for r in runs if r.get("latencyMs", {}).get("p50") is not None]
+    total_requests = sum(r.get("requests", 0) for r in runs)
+    atomic_write_json(metrics_path, {
+        "_meta": {
+            "updatedAt": summary["at"],
+            "runs": len(runs),
+            "medianRunP50Ms": percentile(latencies, 50),
+            "blockRate": round(sum(r.get("blocked", 0) for r in runs) / total_requests, 4) if total_requests else 0.0,
+        },
+        "lastRun": summary,
+        "runs": runs,
+    })
+
+
+class RunBudget:
+    """
+    Stop condition for one run: wall-clock deadline, request cap, a rolling
+    block-rate ceiling (all read from the run's RunMetrics) and an open Pacer
+    circuit that would outlast the deadline (or is open at all when there is
+    no deadline: its cooldown is saved for the next run). The runners ask
+    allows_next() before starting each athlete; the first stop reason sticks.
+    """
+
+    def __init__(self, metrics, seconds=None, max_requests=None, max_block_rate=BUDGET_MAX_BLOCK_RATE, pacer=None):
+        self.metrics = metrics
+        self.pacer = pacer
+        self.deadline = metrics.started + seconds if seconds else None
+        self.max_requests = max_requests
+        self.max_block_rate = max_block_rate
+        self.athletes_started = 0
+        self.stop_reason = None
+
+    def recent_block_rate(self):
+        recent = self.metrics.requests[-BUDGET_BLOCK_WINDOW:]
+        if len(recent) < BUDGET_BLOCK_WINDOW:
+            return 0.0
+        blocked = sum(1 for r in recent if is_blocked(r))
+        return blocked / len(recent)
+
+    def requests_committed(self):
+        """Requests already made or owed by started athletes (one per grader, plus retries so far)."""
+        retries = sum(1 for r in self.metrics.requests if r["attempt"] > 0)
+        return self.athletes_started * len(GRADERS) + retries
+
+    def allows_next(self):
+        if self.stop_reason:
+            return False
+
+        now = time.perf_counter()
+        # Only start an athlete that should finish before the deadline
+        per_athlete = (now - self.metrics.started) / self.athletes_started if self.athletes_started else 0.0
+        if self.deadline is not None and now + per_athlete > self.deadline:
+            self.stop_reason = "deadline"
+        elif self.pacer and self.pacer.open_for() and (self.deadline is None or now + self.pacer.open_for() > self.deadline):
+            self.stop_reason = "breaker"  # circuit stays open past the deadline (or there is none)
+        elif self.max_requests is not None and self.requests_committed() + len(GRADERS) > self.max_requests:
+            self.stop_reason = "requests"
+        elif self.max_block_rate is not None and self.recent_block_rate() > self.max_block_rate:
+            self.stop_reason = "blocks"
+        else:
+            self.athletes_started += 1
+            return True
+
+        print(f"  ⏱ Budget: stopping ({self.stop_reason}) after {self.athletes_started} athlete(s)")
+        return False
+
+
+def save_shard_metrics(path, summary):
+    """Prepend one shard run's summary to its pending metrics file (folded in by the merge)."""
+    runs = []
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                runs = json.load(f).get("runs", [])
+        except Exception:
+            pass
+    atomic_write_json(path, {"runs": [summary] + runs})
+
+
+def polite_sleep(seconds, metrics=None):
+    """time.sleep() that is accounted as idle time in the run metrics."""
+    started = time.perf_counter()
+    time.sleep(seconds)
+    if metrics is not None:
+        metrics.slept(started, time.perf_counter())
+
+
+class Pacer:
+    """
+    AIMD request pacing plus a circuit breaker, shared by every request of a run.
+
+    record() feeds each response outcome ("ok" / "blocked" / "error") into the
+    current rpm (see PACE_*). gate() holds requests while the breaker is open
+    or a Retry-After is pending, and lets exactly one probe through once the
+    cooldown ends. A request whose wait would cross the run's deadline is
+    refused instead of held, and so is every request while the breaker is open
+    in a run without a deadline (the next run resumes the saved cooldown). The async runner mirrors rpm into its TokenBucket; the
+    sequential runner multiplies its polite delays by slowdown().
+    """
+
+    def __init__(self, max_rpm, rpm=None, state="closed", open_until=0.0, cooldown=PACE_BREAKER_COOLDOWN_SEC):
+        self.max_rpm = max_rpm
+        self.min_rpm = max_rpm * PACE_MIN_RATIO
+        self.rpm = max(self.min_rpm, min(max_rpm, rpm or max_rpm))
+        self.state = state  # closed / open / half_open
+        self.open_until = open_until  # epoch seconds
+        self.cooldown = cooldown
+        self.hold_until = 0.0  # epoch seconds (Retry-After)
+        self.consecutive_blocks = 0
+        self.probing = False
+        self.trips = 0
+
+    @classmethod
+    def load(cls, path, max_rpm):
+        """Resume the pace and breaker saved by the previous run (fresh if missing or stale)."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except Exception:
+            return cls(max_rpm)
+
+        saved_at = parse_iso(saved.get("updatedAt"))
+        if not saved_at or datetime.now(timezone.utc) - saved_at > timedelta(hours=PACER_STATE_MAX_AGE_HOURS):
+            return cls(max_rpm)
+        # Pace is stored as a fraction of the configured rate, so --rpm changes carry over
+        breaker = saved.get("breaker", {})
+        return cls(
+            max_rpm,
+            rpm=max_rpm * saved.get("paceRatio", 1.0),
+            state="open" if breaker.get("state") in ("open", "half_open") else "closed",
+            open_until=breaker.get("openUntil", 0.0),
+            cooldown=breaker.get("cooldownSec", PACE_BREAKER_COOLDOWN_SEC),
+        )
+
+    def save(self, path):
+        atomic_write_json(path, {
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+            "rpm": round(self.rpm, 2),
+            "paceRatio": round(self.rpm / self.max_rpm, 4),
+            "breaker": {
+                "state": self.state,
+                "openUntil": self.open_until,
+                "openUntilIso": datetime.fromtimestamp(self.open_until, timezone.utc).isoformat()
+                                if self.state != "closed" else None,
+                "cooldownSec": self.cooldown,
+            },
+        })
+
+    def slowdown(self):
+        return self.max_rpm / self.rpm
+
+    def open_for(self):
+        """Seconds until the breaker lets a probe through (0 unless open)."""
+        return max(0.0, self.open_until - time.time()) if self.state == "open" else 0.0
+
+    def wait_seconds(self):
+        now = time.time()
+        if self.state == "open":
+            if now < self.open_until:
+                return self.open_until - now
+            self.state = "half_open"
+            print("  🔌 Circuit half-open — sending one probe request", file=sys.stderr)
+        if self.state == "half_open" and self.probing:
+            return 1.0  # another worker's probe is in flight
+        return max(0.0, self.hold_until - now)
+
+    def refuses(self, wait, deadline):
+        """True if a `wait` would pass `deadline` (perf_counter), or sit out an open breaker with no deadline."""
+        if deadline is None:
+            return self.state == "open"
+        return time.perf_counter() + wait > deadline
+
+    def gate(self, metrics=None, deadline=None):
+        """Wait until a request may go out; False (without waiting) if refuses() it."""
+        while True:
+            wait = self.wait_seconds()
+            if wait <= 0:
+                break
+            if self.refuses(wait, deadline):
+                return False
+            polite_sleep(wait, metrics)
+        self.probing = self.state == "half_open"
+        return True
+
+    async def gate_async(self, metrics=None, deadline=None):
+        while True:
+            wait = self.wait_seconds()
+            if wait <= 0:
+                break
+            if self.refuses(wait, deadline):
+                return False
+            started = time.perf_counter()
+            await asyncio.sleep(wait)
+            if metrics is not None:
+                metrics.slept(started, time.perf_counter())
+        self.probing = self.state == "half_open"
+        return True
+
+    def trip(self, cooldown):
+        self.state = "open"
+        self.cooldown = min(cooldown, PACE_BREAKER_MAX_COOLDOWN_SEC)
+        self.open_until = time.time() + self.cooldown
+        self.trips += 1
+        print(
+            f"  ⛔ Circuit open for {self.cooldown:g}s after {self.consecutive_blocks} block(s) "
+            f"(pace {self.rpm:.1f} req/min)",
+            file=sys.stderr,
+        )
+
+    def record(self, outcome, retry_after=None):
+        """Update pace + breaker from one response: "ok", "blocked" or "error"."""
+        self.probing = False
+        if retry_after:
+            self.hold_until = max(self.hold_until, time.time() + retry_after)
+
+        if outcome == "ok":
+            self.consecutive_blocks = 0
+            self.rpm = min(self.max_rpm, self.rpm + self.max_rpm * PACE_INCREASE_RATIO)
+            if self.state == "half_open":
+                self.state = "closed"
+                self.cooldown = PACE_BREAKER_COOLDOWN_SEC
+                print(f"  ✅ Circuit closed — resuming at {self.rpm:.1f} req/min", file=sys.stderr)
+        elif outcome == "blocked":
+            self.consecutive_blocks += 1
+            self.rpm = max(self.min_rpm, self.rpm * PACE_BLOCK_DECREASE)
+            if self.state == "half_open":
+                self.trip(self.cooldown * 2)
+            elif self.state == "closed" and self.consecutive_blocks >= PACE_BREAKER_BLOCKS:
+                self.trip(self.cooldown)
+        else:
+            self.rpm = max(self.min_rpm, self.rpm * PACE_ERROR_DECREASE)
+
+
+def retry_after_seconds(resp):
+    """Retry-After header in seconds (numeric form only), else None."""
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
         return None
 
-    return {
-        "cards": cards if cards is not None else 0,
-        "gems": gems if gems is not None else 0,
-        "grades": grades if grades is not None else 0,
-        "gemRate": gem_rate if gem_rate is not None else 0,
-    }
 
+class GemrateSession(requests.Session):
+    """
+    requests.Session with a sticky User-Agent and a cookie jar that can be
+    saved/loaded, so Cloudflare sees one returning browser instead of a new
+    client per request. rotate_identity() starts over after a block.
+    """
+
+    def __init__(self, user_agent=None):
+        super().__init__()
+        self.user_agent = user_agent or random.choice(USER_AGENTS)
+
+    def rotate_identity(self):
+        self.cookies.clear()
+        others = [ua for ua in USER_AGENTS if ua != self.user_agent]
+        self.user_agent = random.choice(others or USER_AGENTS)
+        print("  🔄 Blocked — dropped cookies, switched User-Agent", file=sys.stderr)
 
-def fetch_gemrate(session, player: str, category: str = ""):
-    """POST to gemrate.com and return parsed PSA stats or None."""
+    @classmethod
+    def load(cls, path):
+        """Restore UA + unexpired cookies from `path` (fresh identity if missing)."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except Exception:
+            return cls()
+
+        session = cls(saved.get("userAgent"))
+        now = time.time()
+        for c in saved.get("cookies", []):
+            if c.get("expires") and c["expires"] < now:
+                continue
+            session.cookies.set_cookie(requests.cookies.create_cookie(
+                name=c["name"],
+                value=c["value"],
+                domain=c.get("domain", ""),
+                path=c.get("path", "/"),
+                expires=c.get("expires"),
+                secure=c.get("secure", False),
+            ))
+        return session
+
+    def save(self, path):
+        atomic_write_json(path, {
+            "savedAt": datetime.now(timezone.utc).isoformat(),
+            "userAgent": self.user_agent,
+            "cookies": [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": c.domain,
+                    "path": c.path,
+                    "expires": c.expires,
+                    "secure": c.secure,
+                }
+                for c in self.cookies
+            ],
+        })
+
+
+def rotate_if_sticky(session):
+    """After a block (403/429 or a challenge page), give a GemrateSession a new identity (plain sessions rotate per request)."""
+    if isinstance(session, GemrateSession):
+        session.rotate_identity()
+
+
+def post_player(session, player: str, category: str, grader: str):
+    """Send one /player form POST and return the raw response."""
     data = {
         "player": player,
-        "grader": "psa",
+        "grader": grader,
         "category": category,
         "submit": "Submit",
     }
-
+    return session.post(
+        GEMRATE_URL,
+        data=data,
+        headers=get_headers(getattr(session, "user_agent", None)),
+        timeout=30,
+    )
+
+
+def fetch_gemrate(session, player: str, category: str = "", grader: str = "psa", metrics=None, pacer=None,
+                  archive=None, deadline=None):
+    """
+    POST to gemrate.com and return parsed stats for one grader: NO_RESULTS
+    for a page without graded cards, None if every attempt failed or was
+    blocked, or the Pacer would hold it past `deadline` (every 200 page goes
+    to `archive`).
+    """
+    pacer = pacer or Pacer(ASYNC_REQUESTS_PER_MINUTE)
     for attempt in range(MAX_RETRIES + 1):
+        if attempt > 0:
+            # Retries wait a grader gap stretched by the current slowdown (grows per failure)
+            polite_sleep(random.uniform(GRADER_DELAY_MIN, GRADER_DELAY_MAX) * pacer.slowdown(), metrics)
+        if not pacer.gate(metrics, deadline):
+            print(f"  ⏱ Circuit open (past the time budget or no budget) — giving up on {grader}", file=sys.stderr)
+            return None
+
+        started = time.perf_counter()
         try:
-            resp = session.post(
-                GEMRATE_URL,
-                data=data,
-                headers=get_headers(),
-                timeout=30,
-            )
+            resp = post_player(session, player, category, grader)
+            ended = time.perf_counter()
             if resp.status_code != 200:
+                if metrics is not None:
+                    metrics.request(grader, started, ended, resp.status_code, len(resp.content), attempt)
+                pacer.record("blocked" if resp.status_code in (403, 429) else "error", retry_after_seconds(resp))
+                if resp.status_code in (403, 429):
+                    rotate_if_sticky(session)
                 print(f"  ⚠ HTTP {resp.status_code}", file=sys.stderr)
                 if attempt < MAX_RETRIES:
-                    time.sleep(10 * (attempt + 1))
                     continue
                 return None
 
-            result = parse_summary(resp.text)
+            if archive is not None:
+                archive.add(player, grader, resp.content)
+            result, path = parse_summary_with_path(resp.text)
+            if metrics is not None:
+                metrics.request(grader, started, ended, 200, len(resp.content), attempt, path)
 
             if result == "blocked":
+                pacer.record("blocked")
                 print(f"  🚫 Cloudflare blocked (attempt {attempt+1})", file=sys.stderr)
+                rotate_if_sticky(session)
                 if attempt < MAX_RETRIES:
-                    time.sleep(15 * (attempt + 1))
                     continue
                 return None
 
-            return result
+            pacer.record("ok")
+            return result if result is not None else dict(NO_RESULTS)
 
         except Exception as e:
+            if metrics is not None:
+                metrics.request(grader, started, time.perf_counter(), "error", 0, attempt)
+            pacer.record("error")
             print(f"  ⚠ Error: {e}", file=sys.stderr)
             if attempt < MAX_RETRIES:
-                time.sleep(10)
                 continue
             return None
 
     return None
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by every in-flight request.
+
+    Tokens refill at rate_per_minute / 60 per second up to `capacity`.
+    set_rate() retunes the refill rate (the Pacer's AIMD output).
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def set_rate(self, rate_per_minute: float):
+        # Bank tokens earned at the old rate before switching
+        now = time.monotonic()
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.rate = rate_per_minute / 60.0
+
+
+def timed_post(session, player: str, category: str, grader: str):
+    """post_player() returning (response, started, ended) measured inside the worker thread."""
+    started = time.perf_counter()
+    resp = post_player(session, player, category, grader)
+    return resp, started, time.perf_counter()
+
+
+async def fetch_gemrate_async(session, limiter, player: str, category: str = "", grader: str = "psa", metrics=None,
+                              pacer=None, archive=None, deadline=None):
+    """
+    Async fetch_gemrate(): every attempt spends a bucket token and passes the
+    Pacer gate; each outcome retunes the shared bucket to the Pacer's rpm.
+    """
+    pacer = pacer or Pacer(limiter.rate * 60)
+
+    def record(outcome, retry_after=None):
+        pacer.record(outcome, retry_after)
+        limiter.set_rate(pacer.rpm)
+
+    for attempt in range(MAX_RETRIES + 1):
+        waited = time.perf_counter()
+        await limiter.acquire()
+        if metrics is not None:
+            metrics.slept(waited, time.perf_counter())
+        if not await pacer.gate_async(metrics, deadline):
+            print(f"  ⏱ Circuit open (past the time budget or no budget) — giving up on {player}, {grader}", file=sys.stderr)
+            return None
+
+        started = time.perf_counter()
+        try:
+            resp, started, ended = await asyncio.to_thread(timed_post, session, player, category, grader)
+            if resp.status_code != 200:
+                if metrics is not None:
+                    metrics.request(grader, started, ended, resp.status_code, len(resp.content), attempt)
+                record("blocked" if resp.status_code in (403, 429) else "error", retry_after_seconds(resp))
+                if resp.status_code in (403, 429):
+                    rotate_if_sticky(session)
+                print(f"  ⚠ HTTP {resp.status_code} ({player}, {grader})", file=sys.stderr)
+                if attempt < MAX_RETRIES:
+                    continue
+                return None
+
+            if archive is not None:
+                archive.add(player, grader, resp.content)
+            result, path = parse_summary_with_path(resp.text)
+            if metrics is not None:
+                metrics.request(grader, started, ended, 200, len(resp.content), attempt, path)
+
+            if result == "blocked":
+                record("blocked")
+                print(f"  🚫 Cloudflare blocked ({player}, {grader}, attempt {attempt+1})", file=sys.stderr)
+                rotate_if_sticky(session)
+                if attempt < MAX_RETRIES:
+                    continue
+                return None
+
+            record("ok")
+            return result if result is not None else dict(NO_RESULTS)
+
+        except Exception as e:
+            if metrics is not None:
+                metrics.request(grader, started, time.perf_counter(), "error", 0, attempt)
+            record("error")
+            print(f"  ⚠ Error ({player}, {grader}): {e}", file=sys.stderr)
+            if attempt < MAX_RETRIES:
+                continue
+            return None
+
+    return None
+
+
 def parse_with_recovery(content):
     """Parse JSON, attempting to recover truncated arrays."""
     try:
@@ -210,18 +908,474 @@ def parse_with_recovery(content):
         raise
 
 
+def write_grader_output(base_dir, g, athletes, batch_info, updated_at, minify_public=False):
+    """
+    Serialize one grader output once and write data/ + public/data/ atomically.
+    The public copy reuses the same bytes unless minify_public is set.
+    """
+    output = {
+        "_meta": {
+            "updatedAt": updated_at,
+            "athleteCount": len(athletes),
+            "graders": [g["key"]],
+            "batchInfo": batch_info,
+        },
+        "athletes": athletes,
+    }
+    data_bytes = json.dumps(output, indent=2, ensure_ascii=False).encode("utf-8")
+    if minify_public:
+        public_bytes = json.dumps(output, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    else:
+        public_bytes = data_bytes
+
+    atomic_write_bytes(os.path.join(base_dir, "data", g["output"]), data_bytes)
+    atomic_write_bytes(os.path.join(base_dir, "public", "data", g["output"]), public_bytes)
+
+
+def load_grader_results(output_path):
+    """Load the existing athletes map for one grader output file."""
+    if os.path.exists(output_path):
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("athletes", {})
+        except Exception:
+            pass
+    return {}
+
+
+def load_state(base_dir):
+    """Load per-athlete scrape state ({name: {...}}) from STATE_FILE."""
+    state_path = os.path.join(base_dir, "data", STATE_FILE)
+    if os.path.exists(state_path):
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("athletes", {})
+        except Exception:
+            pass
+    return {}
+
+
+def save_state(base_dir, state):
+    state_path = os.path.join(base_dir, "data", STATE_FILE)
+    payload = {
+        "_meta": {"updatedAt": datetime.now(timezone.utc).isoformat(), "athleteCount": len(state)},
+        "athletes": state,
+    }
+    atomic_write_json(state_path, payload)
+
+
+def shard_of(name, shards):
+    """Stable shard index for an athlete (same on every machine and Python run, unlike hash())."""
+    digest = hashlib.sha1(normalize_name(name).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def parse_shard(value):
+    """argparse type for --shard K/N."""
+    try:
+        k, n = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N (e.g. 0/4), got {value!r}")
+    if n < 1 or not 0 <= k < n:
+        raise argparse.ArgumentTypeError(f"shard index must be 0..N-1, got {value!r}")
+    return k, n
+
+
+def shard_paths(base_dir, shard):
+    """Per-shard progress / journal / metrics / session paths for shard (k, n)."""
+    k, n = shard
+    tag = f"{k}-of-{n}"
+    shard_dir = os.path.join(base_dir, "data", SHARD_DIR)
+    return {
+        "progress": os.path.join(shard_dir, f"progress-{tag}.json"),
+        "journal": os.path.join(shard_dir, f"journal-{tag}.ndjson"),
+        "metrics": os.path.join(shard_dir, f"metrics-{tag}.json"),
+        "pacer": os.path.join(shard_dir, f"pacer-{tag}.json"),
+        "session": os.path.join(base_dir, ".cache", f"gemrate-session-{tag}.json"),
+    }
+
+
+def load_only_names(only, only_file):
+    """Normalized names from --only (comma-separated, repeatable) and --only-file (one per line, # comments)."""
+    raw = []
+    for value in only or []:
+        raw.extend(value.split(","))
+    if only_file:
+        with open(only_file, "r", encoding="utf-8") as f:
+            raw.extend(line.split("#", 1)[0] for line in f)
+    return {normalize_name(name) for name in raw if name.strip()}
+
+
+def parse_iso(value):
+    """Parse an ISO timestamp into an aware UTC datetime, or None."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def load_ebay_activity(base_dir):
+    """Return {name: nListing} from data/ebay-avg.json (empty if missing)."""
+    ebay_path = os.path.join(base_dir, "data", "ebay-avg.json")
+    try:
+        with open(ebay_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    return {
+        name: entry.get("nListing") or 0
+        for name, entry in data.items()
+        if not name.startswith("_") and isinstance(entry, dict)
+    }
+
+
+def total_grades(results, name):
+    """Sum of grades across every grader output for one athlete."""
+    return sum(
+        ((results[g["key"]].get(name) or {}).get("totals") or {}).get("grades", 0)
+        for g in GRADERS
+    )
+
+
+def pick_priority_batch(indexed, state, results, ebay_activity, batch_size, now):
+    """
+    Pick the `batch_size` athletes with the highest effective age from a heap.
+    `indexed` is [(idx, athlete)]; returns the same shape, highest score first.
+    """
+    volumes = {a["name"]: total_grades(results, a["name"]) for _, a in indexed}
+    rates = {a["name"]: (state.get(a["name"]) or {}).get("gradesPerDay", 0) for _, a in indexed}
+    max_volume = math.log1p(max(volumes.values(), default=0)) or 1.0
+    max_rate = math.log1p(max(rates.values(), default=0)) or 1.0
+    max_ebay = math.log1p(max(ebay_activity.values(), default=0)) or 1.0
+
+    heap = []
+    for idx, a in indexed:
+        name = a["name"]
+        last = parse_iso((state.get(name) or {}).get("lastFetchedAt"))
+        age_days = (now - last).total_seconds() / 86400 if last else PRIORITY_NEVER_FETCHED_DAYS
+
+        activity = (
+            PRIORITY_WEIGHTS["volume"] * math.log1p(volumes[name]) / max_volume
+            + PRIORITY_WEIGHTS["change"] * math.log1p(rates[name]) / max_rate
+            + PRIORITY_WEIGHTS["ebay"] * math.log1p(ebay_activity.get(name, 0)) / max_ebay
+        )
+        # Ties fall back to roster order (stable, like round-robin)
+        heapq.heappush(heap, (-age_days * (1 + activity), idx, a))
+
+    return [(idx, a) for _, idx, a in (heapq.heappop(heap) for _ in range(min(batch_size, len(heap))))]
+
+
+def is_due(entry, now):
+    """True when an athlete has no state yet or its nextDueAt has passed."""
+    due = parse_iso((entry or {}).get("nextDueAt"))
+    return due is None or due <= now
+
+
+def classify_outcome(stats_list):
+    """
+    Collapse one athlete's per-grader results into hit / zero / failed: hit if
+    any grader has graded cards, failed if none did and one failed (None),
+    zero if every grader answered without graded cards.
+    """
+    if any(isinstance(stats, dict) and stats["grades"] > 0 for stats in stats_list):
+        return "hit"
+    if any(not isinstance(stats, dict) for stats in stats_list):
+        return "failed"
+    return "zero"
+
+
+def next_due_at(result, entry, now):
+    """Return (nextDueAt, zeroStreak, failStreak) for one classified outcome."""
+    zero_streak = entry.get("zeroStreak", 0)
+    fail_streak = entry.get("failStreak", 0)
+
+    if result == "failed":
+        fail_streak += 1
+        hours = min(DUE_TTL_FAILED_HOURS * 2 ** (fail_streak - 1), DUE_TTL_HIT_DAYS * 24)
+        return now + timedelta(hours=hours), zero_streak, fail_streak
+
+    if result == "zero":
+        zero_streak += 1
+        days = min(DUE_TTL_ZERO_DAYS * 2 ** (zero_streak - 1), DUE_TTL_ZERO_MAX_DAYS)
+        return now + timedelta(days=days), zero_streak, 0
+
+    return now + timedelta(days=DUE_TTL_HIT_DAYS), 0, 0
+
+
+def update_athlete_state(state, name, stats_by_grader, results, now):
+    """
+    Record fetch time, grade totals, change rate, next due date and the last
+    time each grader answered (graderSeenAt, the event feed's baseline) for
+    one athlete.
+    """
+    stats_list = list(stats_by_grader.values())
+    prev = state.get(name) or {}
+    stamp = now.isoformat()
+    if prev.get("lastAttemptAt") == stamp:
+        return  # same journal record replayed twice
+
+    result = classify_outcome(stats_list)
+    due, zero_streak, fail_streak = next_due_at(result, prev, now)
+    entry = {
+        **prev,
+        "lastAttemptAt": stamp,
+        "lastResult": result,
+        "nextDueAt": due.isoformat(),
+        "zeroStreak": zero_streak,
+        "failStreak": fail_streak,
+    }
+
+    # Any grader that answered (hit or zero) counts as a fetch, so a single
+    # failed grader does not leave the athlete "never fetched" for the scheduler
+    if any(isinstance(stats, dict) for stats in stats_list):
+        grades = total_grades(results, name)
+        rate = prev.get("gradesPerDay", 0)
+        last = parse_iso(prev.get("lastFetchedAt"))
+        if last and "grades" in prev:
+            days = max((now - last).total_seconds() / 86400, 1.0)
+            rate = round(max(grades - prev["grades"], 0) / days, 3)
+        entry.update({"lastFetchedAt": stamp, "grades": grades, "gradesPerDay": rate})
+        entry["graderSeenAt"] = {
+            **prev.get("graderSeenAt", {}),
+            **{key: stamp for key, stats in stats_by_grader.items() if isinstance(stats, dict)},
+        }
+
+    state[name] = entry
+
+
+def make_record(a, stats_by_grader):
+    """Journal record for one finished athlete: {"at", "name", "sport", "stats": {key: stats|None}}."""
+    return {
+        "at": datetime.now(timezone.utc).isoformat(),
+        "name": a["name"],
+        "sport": a.get("sport", ""),
+        "stats": stats_by_grader,
+    }
+
+
+def apply_record(results, state, record):
+    """Merge one journal record into the per-grader results and the scrape state."""
+    name = record["name"]
+    for key, stats in record["stats"].items():
+        if key in results and stats and isinstance(stats, dict) and stats["grades"] > 0:
+            results[key][name] = {
+                "name": name,
+                "sport": record.get("sport", ""),
+                "graders": {key: stats},
+                "totals": stats,
+            }
+    at = parse_iso(record.get("at")) or datetime.now(timezone.utc)
+    update_athlete_state(state, name, record["stats"], results, at)
+
+
+class Journal:
+    """Append-only NDJSON file; each append is one write + flush + fsync."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def read(self):
+        """Return every complete record, dropping a torn trailing line if present."""
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, "rb") as f:
+            raw = f.read()
+
+        complete = raw[: raw.rfind(b"\n") + 1]
+        if len(complete) != len(raw):
+            # Crash mid-append: cut the partial line so the next append starts clean
+            with open(self.path, "r+b") as f:
+                f.truncate(len(complete))
+
+        records = []
+        for line in complete.decode("utf-8").splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"  ⚠ Skipping unreadable journal line: {line[:80]}", file=sys.stderr)
+        return records
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def pick_roundrobin_batch(unique, state, start_idx, batch_size, now):
+    """
+    Walk the roster from the cursor (wrapping once) and take the next
+    `batch_size` due athletes. Returns ([(idx, athlete)], next_cursor).
+    """
+    batch = []
+    idx = start_idx
+    for _ in range(len(unique)):
+        if len(batch) >= batch_size:
+            break
+        a = unique[idx]
+        if is_due(state.get(a["name"]), now):
+            batch.append((idx, a))
+        idx = (idx + 1) % len(unique)
+    return batch, idx
+
+
+def print_stats_line(label: str, stats):
+    if stats and isinstance(stats, dict) and stats["grades"] > 0:
+        print(f"{label} ✅ {stats['grades']} grades, {stats['gemRate']}% gem rate")
+    else:
+        print(f"{label} —")
+
+
+def run_batch_sync(batch, total: int, journal, metrics=None, session=None, budget=None, pacer=None, archive=None):
+    """
+    Sequential pass with random polite delays (stretched by the Pacer's
+    slowdown) over [(idx, athlete)], stopping early when `budget` runs out.
+    Journals and returns one record per athlete.
+    """
+    records = []
+    session = session or requests.Session()
+    pacer = pacer or Pacer(ASYNC_REQUESTS_PER_MINUTE)
+    deadline = budget.deadline if budget is not None else None
+
+    for idx, a in batch:
+        if budget is not None and not budget.allows_next():
+            break
+
+        name = a["name"]
+        sport = a.get("sport", "")
+        category = CAT_MAP.get(sport, "")
+
+        cat_label = category if category else "All Categories"
+        print(f"  [{idx + 1}/{total}] {name} ({sport} → {cat_label})")
+
+        stats_by_grader = {}
+        for g_i, g in enumerate(GRADERS):
+            if g_i > 0:
+                polite_sleep(random.uniform(GRADER_DELAY_MIN, GRADER_DELAY_MAX) * pacer.slowdown(), metrics)
+
+            stats = fetch_gemrate(session, name, category, g["grader"], metrics, pacer, archive, deadline)
+            stats_by_grader[g["key"]] = stats
+            print_stats_line(f"    {g['key']}:", stats)
+
+        record = make_record(a, stats_by_grader)
+        journal.append(record)
+        records.append(record)
+
+        # Random polite delay; repeated blocks are handled by the Pacer's breaker
+        delay = random.uniform(DELAY_MIN, DELAY_MAX) * pacer.slowdown()
+        polite_sleep(delay, metrics)
+
+    return records
+
+
+async def run_batch_async(batch, total: int, rpm: float, concurrency: int, journal, metrics=None, session=None,
+                          budget=None, pacer=None, archive=None):
+    """
+    Overlapped pass over [(idx, athlete)]: `concurrency` workers pull
+    (athlete, grader) jobs in order, all drawing from one TokenBucket of `rpm`
+    requests/minute, retuned by the Pacer. No new athlete is started once
+    `budget` runs out; started ones always finish every grader. Journals each
+    athlete as soon as its last grader finishes; returns the records.
+    """
+    pacer = pacer or Pacer(rpm)
+    limiter = TokenBucket(pacer.rpm, capacity=ASYNC_BURST)
+    session = session or requests.Session()
+    deadline = budget.deadline if budget is not None else None
+    pending = {}
+    records = []
+
+    async def one(idx, a, g):
+        name = a["name"]
+        category = CAT_MAP.get(a.get("sport", ""), "")
+        stats = await fetch_gemrate_async(session, limiter, name, category, g["grader"], metrics, pacer, archive,
+                                          deadline)
+        print_stats_line(f"  [{idx + 1}/{total}] {name} {g['key']}:", stats)
+
+        done = pending.setdefault(idx, {})
+        done[g["key"]] = stats
+        if len(done) == len(GRADERS):
+            record = make_record(a, {k["key"]: done[k["key"]] for k in GRADERS})
+            journal.append(record)
+            records.append(record)
+
+    def jobs():
+        for idx, a in batch:
+            if budget is not None and not budget.allows_next():
+                return
+            for g in GRADERS:
+                yield idx, a, g
+
+    # Shared generator: workers never await inside it, so next() cannot interleave
+    queue = jobs()
+
+    async def worker():
+        for idx, a, g in queue:
+            await one(idx, a, g)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return records
+
+
 def main():
-    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    ap = argparse.ArgumentParser(description="Gemrate PSA/SGC/Beckett batch scraper")
+    ap.add_argument("--async", dest="use_async", action="store_true",
+                    help="Overlap requests under a shared token bucket instead of fixed sleeps")
+    ap.add_argument("--rpm", type=float, default=ASYNC_REQUESTS_PER_MINUTE,
+                    help="Requests per minute budget for --async")
+    ap.add_argument("--concurrency", type=int, default=ASYNC_MAX_IN_FLIGHT,
+                    help="Max in-flight requests for --async")
+    ap.add_argument("--batch-size", type=int, default=None,
+                    help=f"Athletes per run (default {BATCH_SIZE}; unlimited with a budget)")
+    ap.add_argument("--time-budget", type=float, default=None, metavar="MINUTES",
+                    help="Keep taking due athletes until this much wall-clock time is used")
+    ap.add_argument("--request-budget", type=int, default=None, metavar="N",
+                    help="Keep taking due athletes until about N requests are used")
+    ap.add_argument("--max-block-rate", type=float, default=BUDGET_MAX_BLOCK_RATE,
+                    help=f"Stop early when this share of the last {BUDGET_BLOCK_WINDOW} requests was blocked")
+    ap.add_argument("--minify-public", action="store_true",
+                    help="Write public/data/gemrate*.json without indentation")
+    ap.add_argument("--persist-session", action="store_true",
+                    help=f"Reuse cookies + a sticky User-Agent from {SESSION_FILE} until blocked")
+    ap.add_argument("--schedule", choices=["roundrobin", "priority"], default="roundrobin",
+                    help="roundrobin: alphabetical cursor; priority: staleness x activity score "
+                         "(both only take athletes whose nextDueAt has passed)")
+    ap.add_argument("--shard", type=parse_shard, default=None, metavar="K/N",
+                    help="Only scrape shard K of N (by name hash) into data/gemrate-shards/; "
+                         "fold shards in with scripts/merge_gemrate_shards.py")
+    ap.add_argument("--only", action="append", default=[os.environ["GEMRATE_ONLY"]] if os.environ.get("GEMRATE_ONLY") else [],
+                    help="Refresh just these athletes now (comma-separated, repeatable; env GEMRATE_ONLY), "
+                         "ignoring due dates and leaving the cursor alone")
+    ap.add_argument("--only-file", default=None, help="File with one athlete name per line for --only")
+    ap.add_argument("--no-archive", action="store_true",
+                    help=f"Do not store raw pages in {ARCHIVE_DIR} (see gemrate_archive.py reparse)")
+    args = ap.parse_args()
+
+    wanted = load_only_names(args.only, args.only_file)
+    if wanted and args.shard:
+        ap.error("--only cannot be combined with --shard")
 
-    # --- cooldown check (added) ---
-    if in_cooldown(base_dir):
-        print("⏳ In 30-day cooldown — skipping run.")
-        return
+    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    priority = args.schedule == "priority"
 
     athletes_path = os.path.join(base_dir, "data", "athletes.json")
-    output_path = os.path.join(base_dir, "data", "gemrate.json")
-    public_path = os.path.join(base_dir, "public", "data", "gemrate.json")
     progress_path = os.path.join(base_dir, "data", "gemrate-progress.json")
+    journal_path = os.path.join(base_dir, "data", JOURNAL_FILE)
+    session_path = os.path.join(base_dir, SESSION_FILE)
+    pacer_path = os.path.join(base_dir, "data", PACER_FILE)
+    if args.shard:
+        paths = shard_paths(base_dir, args.shard)
+        progress_path, journal_path, session_path = paths["progress"], paths["journal"], paths["session"]
+        pacer_path = paths["pacer"]
 
     with open(athletes_path, "r", encoding="utf-8") as f:
         athletes = parse_with_recovery(f.read())
@@ -235,6 +1389,12 @@ def main():
             seen.add(name)
             unique.append(a)
 
+    if args.shard:
+        k, n = args.shard
+        roster_size = len(unique)
+        unique = [a for a in unique if shard_of(a["name"], n) == k]
+        print(f"🧩 Shard {k}/{n}: {len(unique)} of {roster_size} athletes")
+
     # Load progress
     progress = {"startIdx": 0}
     if os.path.exists(progress_path):
@@ -250,108 +1410,213 @@ def main():
     if start_idx >= len(unique):
         start_idx = 0
 
-    end_idx = min(start_idx + BATCH_SIZE, len(unique))
-    batch = unique[start_idx:end_idx]
-
-    print(f"📊 Gemrate PSA batch: athletes {start_idx}–{end_idx - 1} of {len(unique)} (batch size {BATCH_SIZE})")
-
-    # Load existing results to merge
-    existing_data = {"_meta": {}, "athletes": {}}
-    if os.path.exists(output_path):
-        try:
-            with open(output_path, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except Exception:
-            pass
-
-    results = existing_data.get("athletes", {})
-    session = requests.Session()
-    blocked_count = 0
-
-    for i, a in enumerate(batch):
-        name = a["name"]
-        sport = a.get("sport", "")
-        category = CAT_MAP.get(sport, "")
-        idx = start_idx + i
+    budgeted = bool(args.time_budget or args.request_budget)
+    if args.batch_size:
+        batch_size = max(1, args.batch_size)
+    else:
+        batch_size = len(unique) if budgeted else BATCH_SIZE
 
-        cat_label = category if category else "All Categories"
-        print(f"  [{idx + 1}/{len(unique)}] {name} ({sport} → {cat_label})...", end=" ")
-        stats = fetch_gemrate(session, name, category)
-
-        if stats and isinstance(stats, dict) and stats["grades"] > 0:
-            results[name] = {
-                "name": name,
-                "sport": sport,
-                "graders": {"PSA": stats},
-                "totals": stats,
-            }
-            print(f"✅ {stats['grades']} grades, {stats['gemRate']}% gem rate")
-            blocked_count = 0
-        else:
-            if stats is None:
-                blocked_count += 1
-            print("—")
-
-        # Random polite delay
-        delay = random.uniform(DELAY_MIN, DELAY_MAX)
-        time.sleep(delay)
-
-        # If too many consecutive blocks, pause longer
-        if blocked_count > 3:
-            print("  ⏸ Multiple blocks, pausing 60s...", file=sys.stderr)
-            time.sleep(60)
-            blocked_count = 0
-
-    # Compute next batch start
-    next_start = end_idx if end_idx < len(unique) else 0
-
-    # --- if we completed a full cycle, start cooldown (added) ---
-    if next_start == 0:
-        from datetime import datetime, timezone
-        cooldown_path = os.path.join(base_dir, "data", COOLDOWN_FILE)
-        os.makedirs(os.path.dirname(cooldown_path), exist_ok=True)
-        with open(cooldown_path, "w", encoding="utf-8") as f:
-            json.dump({"completedAt": datetime.now(timezone.utc).isoformat()}, f, indent=2)
-        print("🛑 Full cycle complete — entering 30-day cooldown.")
-
-    from datetime import datetime, timezone
-
-    # Save progress
-    progress_out = {
-        "startIdx": next_start,
-        "lastBatchAt": datetime.now(timezone.utc).isoformat(),
-        "lastBatchRange": f"{start_idx}-{end_idx - 1}",
-        "totalAthletes": len(unique),
+    # Load existing results to merge, one map per grader
+    results = {
+        g["key"]: load_grader_results(os.path.join(base_dir, "data", g["output"]))
+        for g in GRADERS
     }
-    os.makedirs(os.path.dirname(progress_path), exist_ok=True)
-    with open(progress_path, "w", encoding="utf-8") as f:
-        json.dump(progress_out, f, indent=2)
-
-    # Save output
-    output = {
-        "_meta": {
-            "updatedAt": datetime.now(timezone.utc).isoformat(),
-            "athleteCount": len(results),
-            "graders": ["PSA"],
-            "batchInfo": {
-                "startIdx": start_idx,
-                "endIdx": end_idx,
-                "totalAthletes": len(unique),
-            },
-        },
-        "athletes": results,
-    }
-
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    os.makedirs(os.path.dirname(public_path), exist_ok=True)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-
-    with open(public_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # Snapshot to detect whether a grader's athlete payload actually changed
+    loaded_results = copy.deepcopy(results)
+    state = load_state(base_dir)
+
+    # Replay athletes finished by a previous run that never reached the final write
+    # (shards: records still waiting for the merge, so due dates account for them)
+    journal = Journal(journal_path)
+    replayed = journal.read()
+    events = []
+    for record in replayed:
+        events += diff_record(results, state, record)
+        apply_record(results, state, record)
+    if replayed and args.shard:
+        print(f"♻️ {len(replayed)} shard record(s) pending merge")
+    elif replayed:
+        print(f"♻️ Replayed {len(replayed)} journaled athlete(s) from an interrupted run")
+
+    now = datetime.now(timezone.utc)
+
+    grader_keys = [g["key"] for g in GRADERS]
+    mode = f"async {args.rpm:g} req/min × {args.concurrency}" if args.use_async else "sequential"
+    limits = [f"batch size {batch_size}"] if not budgeted or args.batch_size else []
+    if args.time_budget:
+        limits.append(f"{args.time_budget:g} min")
+    if args.request_budget:
+        limits.append(f"{args.request_budget} requests")
+    limit_label = ", ".join(limits)
+
+    if wanted:
+        # Targeted refresh: resolve with the same normalization as dedupe_athletes,
+        # fetch regardless of nextDueAt, never move the round-robin cursor
+        batch = [(idx, a) for idx, a in enumerate(unique) if normalize_name(a["name"]) in wanted]
+        unmatched = wanted - {normalize_name(a["name"]) for _, a in batch}
+        for name in sorted(unmatched):
+            print(f"  ⚠ Not in athletes.json: {name}", file=sys.stderr)
+        if not batch:
+            print("✖ --only matched no athletes", file=sys.stderr)
+            sys.exit(1)
+        next_start = start_idx
+        print(f"🎯 Targeted refresh: {len(batch)} athlete(s) × {'/'.join(grader_keys)} ({mode})")
+    else:
+        due = [(idx, a) for idx, a in enumerate(unique) if is_due(state.get(a["name"]), now)]
+        if not due and (not replayed or args.shard):
+            print(f"⏳ No athletes due (of {len(unique)}) — skipping run.")
+            return
+
+        if not due:
+            batch, next_start = [], start_idx
+        elif priority:
+            batch = pick_priority_batch(due, state, results, load_ebay_activity(base_dir), batch_size, now)
+            next_start = start_idx
+            print(
+                f"📊 Gemrate {'/'.join(grader_keys)} priority batch: {len(batch)} of {len(due)} due "
+                f"/ {len(unique)} athletes ({limit_label}, {mode})"
+            )
+        else:
+            batch, next_start = pick_roundrobin_batch(unique, state, start_idx, batch_size, now)
+            print(
+                f"📊 Gemrate {'/'.join(grader_keys)} batch: {len(batch)} due athletes from index {start_idx} "
+                f"({len(due)} due / {len(unique)}, {limit_label}, {mode})"
+            )
 
-    print(f"\n✅ Batch done! {len(results)} total athletes with PSA data. Next batch starts at index {next_start}.")
+    session = None
+    if args.persist_session:
+        session = GemrateSession.load(session_path)
+        print(f"🍪 Session: {len(session.cookies)} cookie(s), sticky UA {session.user_agent[:40]}…")
+
+    # Resume last run's pace; in sequential mode only the ratio to --rpm matters
+    pacer = Pacer.load(pacer_path, args.rpm)
+    print(
+        f"🚦 Pace {pacer.rpm:.1f}/{args.rpm:g} req/min, circuit {pacer.state}"
+        + (f" for {pacer.open_for():.0f}s more" if pacer.open_for() else "")
+    )
+
+    metrics = RunMetrics()
+    budget = RunBudget(
+        metrics,
+        seconds=args.time_budget * 60 if args.time_budget else None,
+        max_requests=args.request_budget,
+        max_block_rate=args.max_block_rate,
+        pacer=pacer,
+    )
+    archive = None if args.no_archive else RawArchive(os.path.join(base_dir, ARCHIVE_DIR))
+    try:
+        if args.use_async:
+            records = asyncio.run(run_batch_async(
+                batch, len(unique), args.rpm, max(1, args.concurrency), journal, metrics, session, budget, pacer,
+                archive
+            ))
+        else:
+            records = run_batch_sync(batch, len(unique), journal, metrics, session, budget, pacer, archive)
+    finally:
+        # Even an interrupted run hands its pace + open breaker to the next one
+        pacer.save(pacer_path)
+    if archive is not None and archive.added:
+        print(f"  📦 Archived {archive.added} page(s) ({archive.new_objects} new) in {ARCHIVE_DIR}")
+
+    # Exact stopping point: the queue prefix whose athletes all finished.
+    # Started athletes always finish, so after an early stop this is everything done.
+    finished = {r["name"] for r in records}
+    done = 0
+    while done < len(batch) and batch[done][1]["name"] in finished:
+        done += 1
+    if done < len(batch):
+        if not priority and not wanted:
+            next_start = (batch[done - 1][0] + 1) % len(unique) if done else start_idx
+        print(f"⏱ Stopped by {budget.stop_reason or 'error'}: {done} of {len(batch)} queued athlete(s) done")
+    batch = batch[:done]
+
+    if session is not None:
+        session.save(session_path)
+
+    for record in records:
+        events += diff_record(results, state, record)
+        apply_record(results, state, record)
+
+    now = datetime.now(timezone.utc)
+    if not args.shard:
+        save_state(base_dir, state)
+
+    if wanted:
+        batch_info = {"mode": "single", "count": len(batch), "totalAthletes": len(unique)}
+    elif not batch:
+        batch_range = "replay"
+        batch_info = {"mode": "replay", "count": len(replayed), "totalAthletes": len(unique)}
+    elif priority:
+        # Round-robin cursor is left alone so switching schedules resumes cleanly
+        batch_range = "priority"
+        batch_info = {"mode": "priority", "count": len(batch), "totalAthletes": len(unique)}
+    else:
+        batch_range = f"{batch[0][0]}-{batch[-1][0]}"
+        batch_info = {"startIdx": start_idx, "endIdx": next_start, "totalAthletes": len(unique)}
+
+    # Save progress (targeted runs leave the cursor file untouched)
+    if not wanted:
+        progress_out = {
+            "startIdx": next_start,
+            "lastBatchAt": now.isoformat(),
+            "lastBatchRange": batch_range,
+            "totalAthletes": len(unique),
+            "graders": grader_keys,
+            "stoppedBy": budget.stop_reason or "complete",
+            "lastAthlete": batch[-1][1]["name"] if batch else None,
+        }
+        atomic_write_json(progress_path, progress_out)
+
+    run_summary = metrics.summary()
+    run_summary.update({
+        "mode": mode,
+        "schedule": "only" if wanted else args.schedule,
+        "athletes": len(batch),
+        "stoppedBy": budget.stop_reason or "complete",
+        "pace": {"rpm": round(pacer.rpm, 2), "circuit": pacer.state, "trips": pacer.trips},
+    })
+
+    if args.shard:
+        # Outputs, state and the rolling metrics file belong to the merge step;
+        # the journal stays behind as this shard's partial result
+        run_summary["shard"] = "/".join(str(part) for part in args.shard)
+        save_shard_metrics(paths["metrics"], run_summary)
+        print(f"🧩 {len(replayed) + len(records)} shard record(s) in {os.path.basename(journal_path)} awaiting merge")
+    else:
+        # Save one output per grader (data/ + public/data/), only when its athletes
+        # changed, so unchanged graders do not get a new updatedAt / git diff
+        updated_at = now.isoformat()
+        for g in GRADERS:
+            if results[g["key"]] == loaded_results[g["key"]]:
+                print(f"  💤 {g['output']}: no athlete changes, not rewritten")
+                continue
+            write_grader_output(base_dir, g, results[g["key"]], batch_info, updated_at, args.minify_public)
+
+        # Every observation (not just the latest) goes into the time series;
+        # replayed records it already holds are skipped by timestamp
+        history_path = os.path.join(base_dir, "data", HISTORY_FILE)
+        history = GemrateHistory.load(history_path)
+        points = sum(history.observe_record(record) for record in replayed + records)
+        history.save(history_path)
+        print(f"  🕒 {HISTORY_FILE}: {points} new point(s)")
+
+        appended = EventFeed(os.path.join(base_dir, "data", EVENTS_FILE)).append(events)
+        if appended:
+            print(f"  📣 {EVENTS_FILE}: {len(appended)} event(s), seq {appended[0]['seq']}–{appended[-1]['seq']}")
+
+        # Everything journaled is now in the outputs
+        journal.clear()
+        save_metrics(base_dir, run_summary)
+
+    print(
+        f"📈 {run_summary['requests']} requests, p50 {run_summary['latencyMs']['p50']} ms, "
+        f"p95 {run_summary['latencyMs']['p95']} ms, block rate {run_summary['blockRate']:.1%}, "
+        f"busy {run_summary['busyPct']}% of {run_summary['wallSec']}s"
+    )
+
+    summary = ", ".join(f"{len(results[k])} {k}" for k in grader_keys)
+    cursor_note = f"Cursor unchanged at index {next_start}" if wanted else f"Next batch starts at index {next_start}"
+    print(f"\n✅ Batch done! Athletes with data: {summary}. {cursor_note}.")
 
 
 if __name__ == "__main__":
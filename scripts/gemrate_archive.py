@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Compressed, content-addressed archive of raw gemrate.com responses, plus a
+re-parse mode that rebuilds data/gemrate*.json from it without any network.
+
+fetch_gemrate.py stores every HTTP 200 page it receives:
+
+  <archive>/objects/ab/abcdef….html.gz   gzip'd body, named by sha256 of the body
+                                         (identical pages are stored once)
+  <archive>/index.ndjson                 {"name", "grader", "date", "at", "sha256", "bytes"}
+                                         one line per fetch, keyed by athlete + grader + date
+
+The archive lives in .cache/gemrate-archive (GEMRATE_ARCHIVE_DIR overrides it),
+outside git; the workflow carries it between runs with actions/cache and
+prunes it first, so it stays bounded: only the newest ARCHIVE_KEEP_PER_KEY
+fetches per athlete + grader are kept, and of those only pages younger than
+ARCHIVE_MAX_AGE_DAYS (the newest one is always kept, for reparse).
+
+After a parser fix:
+  python scripts/gemrate_archive.py stats
+  python scripts/gemrate_archive.py reparse --dry-run          # what would change
+  python scripts/gemrate_archive.py reparse --workers 8        # rewrite data/ + public/data/
+  python scripts/gemrate_archive.py prune [--dry-run]          # apply the retention policy
+"""
+
+import argparse, gzip, hashlib, json, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from atomic_write import atomic_write_text
+
+ARCHIVE_DIR = os.environ.get("GEMRATE_ARCHIVE_DIR", os.path.join(".cache", "gemrate-archive"))
+
+# Retention (prune): newest N fetches per athlete + grader, older ones dropped
+# after this many days unless they are the newest
+ARCHIVE_KEEP_PER_KEY = 3
+ARCHIVE_MAX_AGE_DAYS = 120
+
+
+class RawArchive:
+    """Write side used by the scraper: add() one response body per fetch."""
+
+    def __init__(self, root):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.ndjson")
+        self.added = 0
+        self.new_objects = 0
+
+    def object_path(self, digest):
+        return os.path.join(self.objects, digest[:2], digest + ".html.gz")
+
+    def add(self, name, grader, body: bytes, at=None):
+        """Store `body` (if new) and index it under athlete + grader + date. Returns the sha256."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(body, compresslevel=9, mtime=0))
+            os.replace(tmp_path, path)
+            self.new_objects += 1
+
+        at = at or datetime.now(timezone.utc)
+        entry = {
+            "name": name,
+            "grader": grader,
+            "date": at.strftime("%Y-%m-%d"),
+            "at": at.isoformat(),
+            "sha256": digest,
+            "bytes": len(body),
+        }
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.added += 1
+        return digest
+
+    def entries(self):
+        """Every complete index line, oldest first."""
+        if not os.path.exists(self.index_path):
+            return []
+        out = []
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    out.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return out
+
+    def read(self, digest):
+        with open(self.object_path(digest), "rb") as f:
+            return gzip.decompress(f.read())
+
+    def prune(self, keep=ARCHIVE_KEEP_PER_KEY, max_age_days=ARCHIVE_MAX_AGE_DAYS, now=None, dry_run=False):
+        """
+        Apply the retention policy: rewrite the index with the kept fetches and
+        delete objects no kept fetch points to. Returns (fetches dropped,
+        objects deleted, bytes freed).
+        """
+        entries = self.entries()
+        cutoff = ((now or datetime.now(timezone.utc)) - timedelta(days=max_age_days)).isoformat()
+        by_key = {}
+        for e in entries:
+            by_key.setdefault((e["name"], e["grader"]), []).append(e)
+
+        kept = []
+        for fetches in by_key.values():
+            newest = fetches[-keep:]
+            kept.extend(e for e in newest[:-1] if e["at"] >= cutoff)
+            kept.append(newest[-1])
+        kept.sort(key=lambda e: e["at"])
+
+        live = {e["sha256"] for e in kept}
+        dead = {e["sha256"] for e in entries} - live
+        paths = [self.object_path(d) for d in dead if os.path.exists(self.object_path(d))]
+        freed = sum(os.path.getsize(p) for p in paths)
+        if not dry_run and len(kept) < len(entries):
+            # Index first: a crash in between leaves unreferenced objects, never dangling lines
+            atomic_write_text(self.index_path, "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in kept))
+            for path in paths:
+                os.remove(path)
+        return len(entries) - len(kept), len(paths), freed
+
+
+def parse_object(path):
+    """Process-pool worker: parse one archived page with the current parser."""
+    import fetch_gemrate as fg
+
+    with open(path, "rb") as f:
+        html_content = gzip.decompress(f.read()).decode("utf-8", errors="replace")
+    return fg.parse_summary_with_path(html_content)
+
+
+def parse_all(archive, digests, workers):
+    """{sha256: (result, parse_path)} for every distinct page, parsed across `workers` processes."""
+    digests = sorted(digests)
+    paths = [archive.object_path(d) for d in digests]
+    if workers <= 1:
+        return dict(zip(digests, map(parse_object, paths)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(digests, pool.map(parse_object, paths, chunksize=64)))
+
+
+def reparse(base_dir, archive, workers, dry_run=False, minify_public=False):
+    import fetch_gemrate as fg
+
+    entries = archive.entries()
+    if not entries:
+        print(f"⏳ Archive {archive.root} is empty — nothing to re-parse.")
+        return
+
+    parsed = parse_all(archive, {e["sha256"] for e in entries}, workers)
+    paths = {}
+    for _, path in parsed.values():
+        paths[path] = paths.get(path, 0) + 1
+    print(f"🔍 Parsed {len(parsed)} distinct page(s) from {len(entries)} fetches: "
+          + ", ".join(f"{k} {v}" for k, v in sorted(paths.items())))
+
+    # Newest usable page per athlete + grader (a blocked page falls back to the
+    # previous fetch of the same athlete + grader). A 200 page without graded
+    # cards parses to None and counts as NO_RESULTS, as in fetch_gemrate().
+    grader_keys = {g["grader"]: g["key"] for g in fg.GRADERS}
+    latest = {}
+    for e in entries:
+        result, _ = parsed[e["sha256"]]
+        if result == "blocked" or e["grader"] not in grader_keys:
+            continue
+        latest[(e["name"], grader_keys[e["grader"]])] = result if result is not None else dict(fg.NO_RESULTS)
+
+    with open(os.path.join(base_dir, "data", "athletes.json"), "r", encoding="utf-8") as f:
+        sports = {a.get("name", "").strip(): a.get("sport", "") for a in fg.parse_with_recovery(f.read())}
+
+    results = {
+        g["key"]: fg.load_grader_results(os.path.join(base_dir, "data", g["output"]))
+        for g in fg.GRADERS
+    }
+    changed = {g["key"]: 0 for g in fg.GRADERS}
+    for (name, key), stats in sorted(latest.items()):
+        # Same rule as apply_record(): only athletes with graded cards are listed
+        if stats["grades"] <= 0:
+            continue
+        entry = {"name": name, "sport": sports.get(name, ""), "graders": {key: stats}, "totals": stats}
+        if results[key].get(name) != entry:
+            changed[key] += 1
+            results[key][name] = entry
+
+    for g in fg.GRADERS:
+        print(f"  {g['output']}: {changed[g['key']]} athlete(s) changed, {len(results[g['key']])} total")
+    if dry_run or not any(changed.values()):
+        return
+
+    updated_at = datetime.now(timezone.utc).isoformat()
+    athletes = {name for name, _ in latest}
+    batch_info = {"mode": "reparse", "count": len(athletes), "totalAthletes": len(sports)}
+    for g in fg.GRADERS:
+        if changed[g["key"]]:
+            fg.write_grader_output(base_dir, g, results[g["key"]], batch_info, updated_at, minify_public)
+    print(f"✅ Rebuilt outputs from the archive ({len(athletes)} athletes)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Gemrate raw-response archive")
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Archive size and coverage")
+    rp = sub.add_parser("reparse", help="Rebuild data/gemrate*.json from archived pages (no network)")
+    rp.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes")
+    rp.add_argument("--dry-run", action="store_true", help="Report changes, write nothing")
+    rp.add_argument("--minify-public", action="store_true",
+                    help="Write public/data/gemrate*.json without indentation")
+    pp = sub.add_parser("prune", help="Drop old fetches and their unreferenced pages")
+    pp.add_argument("--keep", type=int, default=ARCHIVE_KEEP_PER_KEY, help="Newest fetches kept per athlete + grader")
+    pp.add_argument("--max-age-days", type=float, default=ARCHIVE_MAX_AGE_DAYS,
+                    help="Drop older fetches (the newest per athlete + grader is always kept)")
+    pp.add_argument("--dry-run", action="store_true", help="Report what would be removed, delete nothing")
+    args = ap.parse_args()
+
+    base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    archive = RawArchive(os.path.join(base_dir, ARCHIVE_DIR))
+
+    if args.command == "stats":
+        entries = archive.entries()
+        digests = {e["sha256"] for e in entries}
+        stored = sum(os.path.getsize(archive.object_path(d)) for d in digests if os.path.exists(archive.object_path(d)))
+        raw = sum(e["bytes"] for e in entries)
+        print(f"📦 {len(entries)} fetches, {len(digests)} distinct pages, "
+              f"{len({(e['name'], e['grader']) for e in entries})} athlete/grader pairs")
+        print(f"   {raw / 1e6:.1f} MB fetched → {stored / 1e6:.2f} MB stored")
+    elif args.command == "prune":
+        dropped, deleted, freed = archive.prune(max(1, args.keep), args.max_age_days, dry_run=args.dry_run)
+        verb = "Would drop" if args.dry_run else "Dropped"
+        print(f"🧹 {verb} {dropped} fetch(es) and {deleted} page(s), {freed / 1e6:.2f} MB")
+    else:
+        reparse(base_dir, archive, max(1, args.workers), args.dry_run, args.minify_public)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Append-only change-event feed for Gemrate stats (data/gemrate-events.ndjson).
+
+fetch_gemrate.py and merge_gemrate_shards.py compare every fetched grader
+result with the previous value before merging it and append what changed:
+
+  first_graded    an athlete previously fetched with 0 grades now has graded cards
+  grade_jump      grades grew by >= EVENT_GRADE_JUMP_MIN and >= EVENT_GRADE_JUMP_PCT
+  gem_rate_shift  gem rate moved by >= EVENT_GEM_RATE_SHIFT points (both sides
+                  with >= EVENT_GEM_RATE_MIN_GRADES grades)
+
+Each line carries a monotonically increasing `seq`. Consumers keep the last
+seq they processed (their cursor) and only read newer lines, either on their
+own or through the named cursors in data/gemrate-events-cursors.json:
+
+  python scripts/gemrate_events.py tail --after 120            # NDJSON events with seq > 120
+  python scripts/gemrate_events.py tail --consumer analysis --ack
+  python scripts/gemrate_events.py tail --type first_graded --consumer flags
+"""
+
+import argparse, json, os, sys
+
+from atomic_write import atomic_write_json
+
+EVENTS_FILE = "gemrate-events.ndjson"
+CURSORS_FILE = "gemrate-events-cursors.json"
+
+EVENT_GRADE_JUMP_MIN = 25
+EVENT_GRADE_JUMP_PCT = 0.10
+EVENT_GEM_RATE_SHIFT = 5.0
+EVENT_GEM_RATE_MIN_GRADES = 20
+
+EVENT_TYPES = ("first_graded", "grade_jump", "gem_rate_shift")
+
+
+def previous_stats(results, state, name, key):
+    """
+    Last known stats for one athlete + grader before a record is merged.
+    Grader maps only keep athletes with grades > 0, so an athlete missing from
+    one that this grader answered for before (state graderSeenAt) had 0
+    grades. None means never observed (no baseline, no events).
+    """
+    entry = results.get(key, {}).get(name)
+    if entry:
+        return (entry.get("graders") or {}).get(key) or entry.get("totals")
+    athlete = state.get(name) or {}
+    # State written before graderSeenAt only set lastFetchedAt when every grader answered
+    seen = athlete.get("graderSeenAt")
+    if (seen or {}).get(key) or (seen is None and athlete.get("lastFetchedAt")):
+        return {"cards": 0, "gems": 0, "grades": 0, "gemRate": 0}
+    return None
+
+
+def diff_record(results, state, record):
+    """Events for one fetch_gemrate journal record, compared with `results` / `state` before apply_record()."""
+    name = record["name"]
+    events = []
+
+    def event(kind, key, **fields):
+        events.append({
+            "id": f"{record.get('at')}|{name}|{key}|{kind}",
+            "at": record.get("at"),
+            "type": kind,
+            "name": name,
+            "sport": record.get("sport", ""),
+            "grader": key,
+            **fields,
+        })
+
+    for key, stats in record.get("stats", {}).items():
+        if not isinstance(stats, dict):
+            continue  # failed grader
+        prev = previous_stats(results, state, name, key)
+        if prev is None:
+            continue
+
+        before, after = prev.get("grades", 0), stats.get("grades", 0)
+        if before == 0 and after > 0:
+            event("first_graded", key, grades=after, gems=stats.get("gems", 0), gemRate=stats.get("gemRate"))
+            continue
+
+        jump = after - before
+        if before > 0 and jump >= EVENT_GRADE_JUMP_MIN and jump >= before * EVENT_GRADE_JUMP_PCT:
+            event("grade_jump", key, **{"from": before, "to": after, "delta": jump})
+
+        if before >= EVENT_GEM_RATE_MIN_GRADES and after >= EVENT_GEM_RATE_MIN_GRADES:
+            shift = (stats.get("gemRate") or 0) - (prev.get("gemRate") or 0)
+            if abs(shift) >= EVENT_GEM_RATE_SHIFT:
+                event("gem_rate_shift", key, **{
+                    "from": prev.get("gemRate"),
+                    "to": stats.get("gemRate"),
+                    "delta": round(shift, 2),
+                })
+
+    return events
+
+
+class EventFeed:
+    """NDJSON feed with a global seq; append() skips events whose id is already in the feed."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def read(self, after=0):
+        """Events with seq > `after`, oldest first."""
+        if not os.path.exists(self.path):
+            return []
+        events = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # torn final line from an interrupted append
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("seq", 0) > after:
+                    events.append(event)
+        return events
+
+    def append(self, events):
+        """Number each new event and append them in one fsync'd write; returns the appended events."""
+        existing = self.read()
+        seen = {e.get("id") for e in existing}
+        seq = existing[-1]["seq"] if existing else 0
+
+        fresh = []
+        for event in events:
+            if event["id"] in seen:
+                continue  # journal replay of a record whose events were already written
+            seen.add(event["id"])
+            seq += 1
+            fresh.append({"seq": seq, **event})
+        if not fresh:
+            return []
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in fresh))
+            f.flush()
+            os.fsync(f.fileno())
+        return fresh
+
+
+def load_cursors(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Read the Gemrate change-event feed")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    tail = sub.add_parser("tail", help="Print events newer than a cursor as NDJSON")
+    tail.add_argument("--after", type=int, default=None, help="Explicit cursor (last seq already processed)")
+    tail.add_argument("--consumer", default=None, help=f"Named cursor stored in data/{CURSORS_FILE}")
+    tail.add_argument("--ack", action="store_true", help="Advance the consumer's cursor past the printed events")
+    tail.add_argument("--type", choices=EVENT_TYPES, action="append", help="Only these event types (repeatable)")
+    args = ap.parse_args()
+
+    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    feed = EventFeed(os.path.join(base_dir, "data", EVENTS_FILE))
+    cursors_path = os.path.join(base_dir, "data", CURSORS_FILE)
+    cursors = load_cursors(cursors_path)
+
+    after = args.after
+    if after is None:
+        after = cursors.get(args.consumer, 0) if args.consumer else 0
+
+    events = feed.read(after)
+    for event in events:
+        if not args.type or event["type"] in args.type:
+            print(json.dumps(event, ensure_ascii=False))
+
+    if args.ack:
+        if not args.consumer:
+            ap.error("--ack needs --consumer")
+        # Filtered-out types are skipped for this consumer too, so the cursor is the last seq read
+        cursors[args.consumer] = events[-1]["seq"] if events else after
+        atomic_write_json(cursors_path, cursors)
+        print(f"✅ {args.consumer} cursor at seq {cursors[args.consumer]}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
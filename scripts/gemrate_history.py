@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Per-athlete, per-grader time series of Gemrate population stats.
+
+fetch_gemrate.py (and merge_gemrate_shards.py) append every observation here
+instead of only keeping the latest value. A point is stored only when one of
+cards / gems / grades / gemRate differs from the previous point; unchanged
+observations just move the series' `seen` timestamp.
+
+Storage (data/gemrate-history.json) is columnar: one object per athlete and
+grader holding parallel arrays, one athlete per line so git diffs stay small:
+
+  {"_meta": {...},
+   "series": {
+  "Ronald Acuna Jr.": {"PSA": {"t": [epoch s, ...], "cards": [...], "gems": [...],
+                               "grades": [...], "gemRate": [...], "seen": epoch s}, ...},
+   ...}}
+
+In memory each column is an array.array, and point lookups use bisect on t.
+
+Usage:
+  python scripts/gemrate_history.py velocity "Ronald Acuna Jr." [--grader PSA] [--field grades]
+  python scripts/gemrate_history.py gainers [--grader PSA] [--field gems] [--since-days 21] [--limit 20]
+  python scripts/gemrate_history.py backfill      # seed one point per athlete from data/gemrate*.json
+"""
+
+import argparse, bisect, json, os, sys
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from atomic_write import atomic_write_text
+
+HISTORY_FILE = "gemrate-history.json"
+
+INT_COLUMNS = ("cards", "gems", "grades")
+COLUMNS = INT_COLUMNS + ("gemRate",)
+
+# Grader key -> output file (mirrors fetch_gemrate.GRADERS; used by backfill)
+GRADER_OUTPUTS = {"PSA": "gemrate.json", "SGC": "gemrate_sgc.json", "beckett": "gemrate_beckett.json"}
+
+
+def to_epoch(value):
+    """ISO-8601 string or datetime -> int epoch seconds (None if unparseable)."""
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def month_of(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m")
+
+
+class Series:
+    """Deduplicated observations for one athlete + grader, one array per column."""
+
+    __slots__ = ("t", "cards", "gems", "grades", "gemRate", "seen")
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.t = array("q", data.get("t", []))
+        for col in INT_COLUMNS:
+            setattr(self, col, array("q", data.get(col, [])))
+        self.gemRate = array("d", data.get("gemRate", []))
+        self.seen = data.get("seen", self.t[-1] if self.t else 0)
+
+    def __len__(self):
+        return len(self.t)
+
+    def append(self, epoch, stats):
+        """Add one observation; returns True if it became a new point."""
+        if epoch <= self.seen:
+            return False  # replayed or out-of-order observation
+        self.seen = epoch
+
+        values = [int(stats.get(col) or 0) for col in INT_COLUMNS] + [float(stats.get("gemRate") or 0)]
+        if self.t and values == [getattr(self, col)[-1] for col in COLUMNS]:
+            return False
+
+        self.t.append(epoch)
+        for col, value in zip(COLUMNS, values):
+            getattr(self, col).append(value)
+        return True
+
+    def value_at(self, epoch, field="grades"):
+        """Value of `field` as of `epoch` (last point at or before it), 0 before the first point."""
+        i = bisect.bisect_right(self.t, epoch)
+        return getattr(self, field)[i - 1] if i else 0
+
+    def to_json(self):
+        out = {"t": self.t.tolist()}
+        for col in COLUMNS:
+            out[col] = getattr(self, col).tolist()
+        out["seen"] = self.seen
+        return out
+
+
+class GemrateHistory:
+    """All series, keyed {athlete name: {grader key: Series}}."""
+
+    def __init__(self, series=None):
+        self.series = series or {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f).get("series", {})
+        except FileNotFoundError:
+            return cls()
+        except Exception as e:
+            print(f"⚠ Could not read {path} ({e}), starting a new history", file=sys.stderr)
+            return cls()
+        return cls({
+            name: {grader: Series(cols) for grader, cols in graders.items()}
+            for name, graders in data.items()
+        })
+
+    def save(self, path):
+        """Atomic write, one athlete per line."""
+        points = sum(len(s) for graders in self.series.values() for s in graders.values())
+        meta = {
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+            "athletes": len(self.series),
+            "points": points,
+            "columns": ["t"] + list(COLUMNS),
+        }
+        lines = [
+            json.dumps(name, ensure_ascii=False) + ": "
+            + json.dumps({g: s.to_json() for g, s in sorted(graders.items())}, separators=(",", ":"))
+            for name, graders in sorted(self.series.items())
+        ]
+        body = (
+            '{"_meta": ' + json.dumps(meta) + ',\n"series": {\n'
+            + ",\n".join(lines)
+            + "\n}}\n"
+        )
+
+        atomic_write_text(path, body)
+
+    def get(self, name, grader):
+        return (self.series.get(name) or {}).get(grader)
+
+    def observe(self, name, grader, at, stats):
+        """Record one grader's stats for an athlete at `at` (ISO string or datetime)."""
+        epoch = to_epoch(at)
+        if epoch is None or not isinstance(stats, dict):
+            return False
+        series = self.series.setdefault(name, {}).setdefault(grader, Series())
+        return series.append(epoch, stats)
+
+    def observe_record(self, record):
+        """Record a fetch_gemrate journal record; failed graders (None) are skipped."""
+        return sum(
+            self.observe(record["name"], grader, record.get("at"), stats)
+            for grader, stats in record.get("stats", {}).items()
+        )
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def added_by_month(self, name, grader="PSA", field="grades"):
+        """[(YYYY-MM, added)] — change in `field` attributed to the month it was observed."""
+        series = self.get(name, grader)
+        if not series:
+            return []
+        values = getattr(series, field)
+        months = {month_of(series.t[0]): 0}
+        for i in range(1, len(series)):
+            month = month_of(series.t[i])
+            months[month] = months.get(month, 0) + values[i] - values[i - 1]
+        return sorted(months.items())
+
+    def top_gainers(self, grader="PSA", field="gems", since=None, limit=20):
+        """
+        Athletes with the largest increase in `field` since `since` (epoch s /
+        ISO / datetime), e.g. the most PSA 10s gained since the last cycle.
+        Returns [(name, gain, before, now)], largest first.
+        """
+        since_epoch = to_epoch(since) if since is not None else 0
+        gains = []
+        for name, graders in self.series.items():
+            series = graders.get(grader)
+            if not series or series.t[-1] <= since_epoch:
+                continue
+            values = getattr(series, field)
+            # Series that start inside the window are measured from their first point
+            before = series.value_at(since_epoch, field) if series.t[0] <= since_epoch else values[0]
+            now = values[-1]
+            if now != before:
+                gains.append((name, now - before, before, now))
+        gains.sort(key=lambda g: (-g[1], g[0]))
+        return gains[:limit]
+
+
+def backfill(base_dir, history):
+    """Seed one point per athlete + grader from the current outputs (state lastFetchedAt or file updatedAt)."""
+    state = {}
+    try:
+        with open(os.path.join(base_dir, "data", "gemrate-state.json"), "r", encoding="utf-8") as f:
+            state = json.load(f).get("athletes", {})
+    except Exception:
+        pass
+
+    added = 0
+    for grader, output in GRADER_OUTPUTS.items():
+        try:
+            with open(os.path.join(base_dir, "data", output), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            continue
+        updated_at = data.get("_meta", {}).get("updatedAt")
+        for name, entry in data.get("athletes", {}).items():
+            at = (state.get(name) or {}).get("lastFetchedAt") or updated_at
+            added += history.observe(name, grader, at, (entry.get("graders") or {}).get(grader) or entry.get("totals"))
+    return added
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Query the Gemrate population time series")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    vel = sub.add_parser("velocity", help="Per-month change for one athlete")
+    vel.add_argument("name")
+    vel.add_argument("--grader", default="PSA", choices=list(GRADER_OUTPUTS))
+    vel.add_argument("--field", default="grades", choices=list(COLUMNS))
+
+    gain = sub.add_parser("gainers", help="Largest increases since a point in time")
+    gain.add_argument("--grader", default="PSA", choices=list(GRADER_OUTPUTS))
+    gain.add_argument("--field", default="gems", choices=list(COLUMNS))
+    gain.add_argument("--since-days", type=float, default=21,
+                      help="Compare against values this many days ago (default: one hit-TTL cycle)")
+    gain.add_argument("--limit", type=int, default=20)
+
+    sub.add_parser("backfill", help="Seed the history from the current data/gemrate*.json")
+    args = ap.parse_args()
+
+    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    history_path = os.path.join(base_dir, "data", HISTORY_FILE)
+    history = GemrateHistory.load(history_path)
+
+    if args.command == "velocity":
+        rows = history.added_by_month(args.name, args.grader, args.field)
+        if not rows:
+            print(f"⚠ No {args.grader} history for {args.name}")
+            return
+        print(f"📈 {args.name} — {args.grader} {args.field} added per month")
+        for month, added in rows:
+            print(f"  {month}  {added:+g}")
+
+    elif args.command == "gainers":
+        since = datetime.now(timezone.utc) - timedelta(days=args.since_days)
+        rows = history.top_gainers(args.grader, args.field, since, args.limit)
+        print(f"🏆 Top {args.grader} {args.field} gainers since {since.date()}")
+        for name, delta, before, now in rows:
+            print(f"  {delta:+8g}  {name} ({before:g} → {now:g})")
+
+    elif args.command == "backfill":
+        added = backfill(base_dir, history)
+        history.save(history_path)
+        print(f"✅ Backfilled {added} point(s) into {HISTORY_FILE}")
+
+
+if __name__ == "__main__":
+    main()
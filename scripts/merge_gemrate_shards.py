@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Fold sharded Gemrate runs (fetch_gemrate.py --shard K/N) into the shared outputs.
+
+Every shard leaves its finished athletes in data/gemrate-shards/journal-K-of-N.ndjson.
+This merges all shard journals, in a deterministic order (record time, then
+name), into data/gemrate*.json + public/data/gemrate*.json,
+data/gemrate-state.json, the data/gemrate-history.json time series and the
+data/gemrate-events.ndjson change feed, folds the shard run summaries into
+data/gemrate-metrics.json, then removes the merged journals.
+
+An athlete is only ever in one shard for a given N, and records are merged into
+name-keyed maps, so re-running the merge or changing N between cycles never
+double-counts an athlete: the newest record for a name wins.
+
+Usage:
+  python scripts/merge_gemrate_shards.py
+  python scripts/merge_gemrate_shards.py --minify-public
+  python scripts/merge_gemrate_shards.py --dry-run     # report only, write nothing
+"""
+
+import argparse, copy, glob, json, os, re, sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fetch_gemrate as fg  # noqa: E402
+from gemrate_events import EVENTS_FILE, EventFeed, diff_record  # noqa: E402
+from gemrate_history import HISTORY_FILE, GemrateHistory  # noqa: E402
+
+SHARD_JOURNAL_RE = re.compile(r"journal-(\d+)-of-(\d+)\.ndjson$")
+
+
+def collect_records(shard_dir):
+    """
+    Read every shard journal. Returns (records, journals), with records sorted
+    by (at, name) and exact duplicates (same name + time) dropped.
+    """
+    records, journals, seen = [], [], set()
+    misplaced = 0
+
+    for path in sorted(glob.glob(os.path.join(shard_dir, "journal-*-of-*.ndjson"))):
+        m = SHARD_JOURNAL_RE.search(path)
+        if not m:
+            continue
+        k, n = int(m.group(1)), int(m.group(2))
+        journal = fg.Journal(path)
+        shard_records = journal.read()
+        journals.append(journal)
+        print(f"  🧩 {os.path.basename(path)}: {len(shard_records)} record(s)")
+
+        for record in shard_records:
+            if fg.shard_of(record["name"], n) != k:
+                misplaced += 1
+            key = (record["name"], record.get("at"))
+            if key in seen:
+                continue
+            seen.add(key)
+            records.append(record)
+
+    if misplaced:
+        print(f"  ⚠ {misplaced} record(s) not in their hash shard (edited journal?) — merged anyway",
+              file=sys.stderr)
+
+    records.sort(key=lambda r: (r.get("at") or "", r["name"]))
+    return records, journals
+
+
+def collect_metrics(shard_dir):
+    """Return (run summaries oldest first, metrics file paths)."""
+    runs, paths = [], sorted(glob.glob(os.path.join(shard_dir, "metrics-*-of-*.json")))
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                runs.extend(json.load(f).get("runs", []))
+        except Exception as e:
+            print(f"  ⚠ Skipping unreadable {os.path.basename(path)}: {e}", file=sys.stderr)
+    runs.sort(key=lambda r: r.get("at") or "")
+    return runs, paths
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Merge sharded Gemrate journals into data/gemrate*.json")
+    ap.add_argument("--minify-public", action="store_true",
+                    help="Write public/data/gemrate*.json without indentation")
+    ap.add_argument("--dry-run", action="store_true", help="Report what would be merged, write nothing")
+    args = ap.parse_args()
+
+    base_dir = os.path.join(os.path.dirname(__file__), "..")
+    shard_dir = os.path.join(base_dir, "data", fg.SHARD_DIR)
+
+    records, journals = collect_records(shard_dir)
+    runs, metrics_paths = collect_metrics(shard_dir)
+    if not records and not runs:
+        print("⏳ No shard journals to merge.")
+        return
+
+    results = {
+        g["key"]: fg.load_grader_results(os.path.join(base_dir, "data", g["output"]))
+        for g in fg.GRADERS
+    }
+    loaded_results = copy.deepcopy(results)
+    state = fg.load_state(base_dir)
+
+    events = []
+    for record in records:
+        events += diff_record(results, state, record)
+        fg.apply_record(results, state, record)
+
+    names = {r["name"] for r in records}
+    print(f"🔀 Merging {len(records)} record(s) for {len(names)} athlete(s) from {len(journals)} shard(s)")
+    if args.dry_run:
+        for g in fg.GRADERS:
+            changed = results[g["key"]] != loaded_results[g["key"]]
+            print(f"  {g['output']}: {len(results[g['key']])} athletes ({'changed' if changed else 'unchanged'})")
+        print(f"  {len(events)} change event(s)")
+        return
+
+    fg.save_state(base_dir, state)
+
+    athletes_path = os.path.join(base_dir, "data", "athletes.json")
+    with open(athletes_path, "r", encoding="utf-8") as f:
+        total = len({a.get("name", "").strip() for a in fg.parse_with_recovery(f.read()) if a.get("name")})
+
+    updated_at = datetime.now(timezone.utc).isoformat()
+    batch_info = {"mode": "shards", "shards": len(journals), "count": len(names), "totalAthletes": total}
+    for g in fg.GRADERS:
+        if results[g["key"]] == loaded_results[g["key"]]:
+            print(f"  💤 {g['output']}: no athlete changes, not rewritten")
+            continue
+        fg.write_grader_output(base_dir, g, results[g["key"]], batch_info, updated_at, args.minify_public)
+
+    history_path = os.path.join(base_dir, "data", HISTORY_FILE)
+    history = GemrateHistory.load(history_path)
+    points = sum(history.observe_record(record) for record in records)
+    history.save(history_path)
+    print(f"  🕒 {HISTORY_FILE}: {points} new point(s)")
+
+    appended = EventFeed(os.path.join(base_dir, "data", EVENTS_FILE)).append(events)
+    if appended:
+        print(f"  📣 {EVENTS_FILE}: {len(appended)} event(s), seq {appended[0]['seq']}–{appended[-1]['seq']}")
+
+    # Only now that outputs + state are on disk do the partials go away
+    for journal in journals:
+        journal.clear()
+
+    for summary in runs:
+        fg.save_metrics(base_dir, summary)
+    for path in metrics_paths:
+        os.remove(path)
+
+    summary = ", ".join(f"{len(results[g['key']])} {g['key']}" for g in fg.GRADERS)
+    print(f"\n✅ Shards merged! Athletes with data: {summary}.")
+
+
+if __name__ == "__main__":
+    main()